@@ -0,0 +1,63 @@
+"""Command-line interface for AutoHistorian.
+
+Each command lives in its own module under ``commands``. Only the command
+named on the command line is imported and registered, so startup cost does
+not grow with the number of commands.
+"""
+
+import importlib
+import sys
+
+import typer
+
+app = typer.Typer(
+    name="autohistorian",
+    help="Synthesize Wikipedia-style articles from news sources with dual timelines.",
+    # Plain help rendering and no shell-completion options keep startup lean
+    rich_markup_mode=None,
+    add_completion=False,
+)
+
+# Command name -> module under .commands (the function has the same name as the module)
+COMMANDS = {
+    "ingest": "ingest",
+    "generate": "generate",
+    "timeline": "timeline",
+    "topics": "topics",
+    "stats": "stats",
+    "ingest-archive": "ingest_archive",
+    "crawl-archive": "crawl_archive",
+}
+
+
+@app.callback()
+def _callback():
+    # Keeps typer in multi-command mode when only one command is registered
+    pass
+
+
+def _register(name: str) -> None:
+    """Import a command module and register its function with the app."""
+    module_name = COMMANDS[name]
+    module = importlib.import_module(f".commands.{module_name}", __name__)
+    app.command(name)(getattr(module, module_name))
+
+
+def _selected_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, if it is a known command."""
+    for arg in argv[1:]:
+        if arg.startswith("-"):
+            continue
+        return arg if arg in COMMANDS else None
+    return None
+
+
+def main() -> None:
+    """Entry point: register the requested command (or all, for help) and run."""
+    name = _selected_command(sys.argv)
+    if name is not None:
+        _register(name)
+    else:
+        for command in COMMANDS:
+            _register(command)
+    app()
@@ -0,0 +1,5 @@
+"""Allow running the CLI with ``python -m autohistorian.cli``."""
+
+from . import main
+
+main()
@@ -0,0 +1 @@
+"""CLI command implementations, one module per command."""
@@ -0,0 +1,151 @@
+"""Crawl the NYT Archive API month by month."""
+
+import asyncio
+from pathlib import Path
+
+import orjson
+import typer
+
+from ...config import get_settings
+from ..common import console, run_async
+
+
+def crawl_archive(
+    start_year: int = typer.Option(
+        2026, "--start-year", "-y", help="Year to start crawling from"
+    ),
+    start_month: int = typer.Option(
+        1, "--start-month", "-m", help="Month to start crawling from (1-12)"
+    ),
+    end_year: int = typer.Option(1851, "--end-year", help="Year to stop at"),
+    end_month: int = typer.Option(9, "--end-month", help="Month to stop at"),
+    daily_limit: int = typer.Option(500, "--limit", "-l", help="Daily request limit"),
+    max_concurrent: int = typer.Option(
+        4, "--concurrency", "-c", help="Maximum concurrent archive downloads"
+    ),
+    output_dir: str | None = typer.Option(
+        None, "--output", "-o", help="Output directory for archive files"
+    ),
+):
+    """Crawl the NYT Archive API backwards from a starting date.
+
+    Downloads all articles month by month, several months concurrently,
+    saving each as a JSON file. Stops when hitting the daily limit and
+    outputs the resume command.
+
+    \b
+    Examples:
+        autohistorian crawl-archive                          # Start from Jan 2026
+        autohistorian crawl-archive -y 2024 -m 6             # Start from June 2024
+        autohistorian crawl-archive -y 2020 -m 1 -o ./data   # Custom output dir
+    """
+    settings = get_settings()
+
+    if not settings.nyt_api_key:
+        console.print("[red]Error: AUTOHISTORIAN_NYT_API_KEY not set[/red]")
+        raise typer.Exit(1)
+
+    # Set output directory
+    archive_dir = (
+        Path(output_dir) if output_dir else Path(settings.data_dir) / "archive"
+    )
+    archive_dir.mkdir(parents=True, exist_ok=True)
+
+    async def run():
+        from ...ingest.nyt_client import NYTClient
+
+        async with NYTClient(settings.nyt_api_key) as client:
+            requests_made = 0
+
+            console.print(
+                f"[cyan]Starting archive crawl from {start_year}/{start_month:02d}[/cyan]"
+            )
+            console.print(f"[cyan]Saving to: {archive_dir}[/cyan]")
+            console.print()
+
+            # Collect months (newest first) that still need downloading
+            pending = []
+            current_year = start_year
+            current_month = start_month
+            while (current_year, current_month) >= (end_year, end_month):
+                # Check if file already exists (skip if already downloaded)
+                output_file = archive_dir / f"{current_year}-{current_month:02d}.json"
+                if output_file.exists():
+                    console.print(
+                        f"[dim]Skipping {current_year}/{current_month:02d} (already exists)[/dim]"
+                    )
+                else:
+                    pending.append((current_year, current_month))
+
+                # Move to previous month
+                current_month -= 1
+                if current_month < 1:
+                    current_month = 12
+                    current_year -= 1
+
+            to_fetch = pending[:daily_limit]
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def fetch_one(year: int, month: int) -> None:
+                nonlocal requests_made
+                async with semaphore:
+                    archive = await client.fetch_archive(year, month)
+                    requests_made += 1
+
+                    # Save to file (compact; orjson serializes UUIDs and datetimes natively)
+                    output_data = {
+                        "year": archive.year,
+                        "month": archive.month,
+                        "total_articles": archive.total_hits,
+                        "articles": [a.model_dump() for a in archive.articles],
+                    }
+                    output_file = archive_dir / f"{year}-{month:02d}.json"
+                    await asyncio.to_thread(
+                        output_file.write_bytes,
+                        orjson.dumps(output_data, option=orjson.OPT_UTC_Z),
+                    )
+
+                    console.print(
+                        f"Fetched {year}/{month:02d}: [green]{archive.total_hits} articles[/green] "
+                        f"({requests_made}/{daily_limit} requests)"
+                    )
+
+            tasks = [asyncio.create_task(fetch_one(y, m)) for y, m in to_fetch]
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as e:  # noqa: BLE001 - any failure saves the resume point
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+                # Resume from the newest month that didn't finish downloading
+                resume_year, resume_month = next(
+                    month
+                    for month, task in zip(to_fetch, tasks)
+                    if task.cancelled() or task.exception() is not None
+                )
+                console.print(f"[red]Error: {e}[/red]")
+                console.print()
+                console.print("[green]To resume, run:[/green]")
+                console.print(
+                    f"  autohistorian crawl-archive -y {resume_year} -m {resume_month}"
+                )
+                return
+
+            # Check if we've hit the daily limit
+            if len(pending) > daily_limit:
+                resume_year, resume_month = pending[daily_limit]
+                console.print()
+                console.print("[yellow]Daily limit reached![/yellow]")
+                console.print()
+                console.print("[green]To resume tomorrow, run:[/green]")
+                console.print(
+                    f"  autohistorian crawl-archive -y {resume_year} -m {resume_month}"
+                )
+                return
+
+            console.print()
+            console.print("[green]Archive crawl complete![/green]")
+            console.print(f"Total requests: {requests_made}")
+
+    run_async(run())
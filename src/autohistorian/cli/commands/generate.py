@@ -0,0 +1,67 @@
+"""Generate a Wikipedia-style article for a topic."""
+
+from pathlib import Path
+
+import typer
+
+from ...config import get_settings
+from ..common import console, get_api_keys, run_async
+
+
+def generate(
+    topic: str = typer.Argument(..., help="Topic to generate article for"),
+    output: str | None = typer.Option(None, "--output", "-o", help="Output file path"),
+    perspectives: bool = typer.Option(
+        False, "--perspectives", "-p", help="Include perspectives section"
+    ),
+    model: str | None = typer.Option(None, "--model", help="Gemini model to use"),
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Data directory"),
+):
+    """Generate a Wikipedia-style article for a topic."""
+    _, gemini_key = get_api_keys()
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+
+    async def run():
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        from ...knowledge.store import KnowledgeStore
+        from ...llm.client import GeminiClient
+        from ...synthesize.writer import ArticleWriter
+
+        llm_client = GeminiClient(gemini_key, model=model or settings.gemini_model)
+        store = KnowledgeStore(data_dir)
+        writer = ArticleWriter(llm_client, store)
+
+        # Check if topic exists
+        topic_names = store.get_topics()
+        if topic not in topic_names:
+            console.print(
+                f"[yellow]Topic '{topic}' not found. Available topics:[/yellow]"
+            )
+            for t in topic_names:
+                console.print(f"  - {t}")
+            raise typer.Exit(1)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Generating article...", total=None)
+
+            if perspectives:
+                article = await writer.generate_with_perspectives(topic)
+            else:
+                article = await writer.generate_article(topic)
+
+            progress.update(task, description="Article generated!")
+
+        if output:
+            Path(output).write_text(article)
+            console.print(f"[green]Article saved to {output}[/green]")
+        else:
+            console.print()
+            console.print(article)
+
+    run_async(run())
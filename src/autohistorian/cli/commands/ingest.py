@@ -0,0 +1,154 @@
+"""Ingest recent articles from the NYT Article Search API."""
+
+import asyncio
+import heapq
+from contextlib import aclosing
+from pathlib import Path
+
+import typer
+
+from ...config import get_settings
+from ..common import console, get_api_keys, run_async
+
+
+def ingest(
+    query: str | None = typer.Argument(
+        None, help="Search query (optional - if omitted, fetches recent news)"
+    ),
+    days: int = typer.Option(7, "--days", "-d", help="Number of days to look back"),
+    max_articles: int = typer.Option(
+        50, "--max", "-m", help="Maximum articles to fetch"
+    ),
+    sections: str | None = typer.Option(
+        None,
+        "--sections",
+        "-s",
+        help="Comma-separated sections (e.g., 'Politics,U.S.')",
+    ),
+    model: str | None = typer.Option(
+        None,
+        "--model",
+        help="Gemini model to use (e.g., gemini-2.5-flash-preview-05-20)",
+    ),
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Data directory"),
+):
+    """Ingest articles from the last N days and auto-discover topics.
+
+    If no query is provided, fetches recent articles from major news sections.
+    Topics are automatically extracted from article content.
+
+    \b
+    Examples:
+        autohistorian ingest --days 7                    # Recent news, auto-discover topics
+        autohistorian ingest "immigration" --days 30    # Search for specific topic
+        autohistorian ingest --sections "Politics,U.S." # Filter by sections
+    """
+    nyt_key, gemini_key = get_api_keys()
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+
+    # Parse sections
+    section_list = None
+    if sections:
+        section_list = [s.strip() for s in sections.split(",")]
+
+    async def run():
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+        )
+
+        from ...extract.pipeline import ExtractionPipeline
+        from ...ingest.nyt_client import NYTClient
+        from ...knowledge.store import KnowledgeStore
+        from ...llm.cache import ResponseCache
+        from ...llm.client import GeminiClient
+
+        llm_client = GeminiClient(gemini_key, model=model or settings.gemini_model)
+        store = KnowledgeStore(data_dir)
+        cache = ResponseCache(Path(data_dir) / "llm_cache")
+        pipeline = ExtractionPipeline(llm_client, cache=cache)
+
+        discovered_topics: set[str] = set()
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            # Fetch articles
+            async with NYTClient(nyt_key) as nyt_client:
+                if query:
+                    task = progress.add_task(
+                        f"Fetching articles for '{query}'...", total=None
+                    )
+                    articles = await nyt_client.search_recent(
+                        query=query,
+                        days=days,
+                        max_articles=max_articles,
+                        sections=section_list,
+                    )
+                else:
+                    task = progress.add_task(
+                        f"Fetching recent articles (last {days} days)...", total=None
+                    )
+                    articles = await nyt_client.fetch_recent(
+                        days=days, max_articles=max_articles, sections=section_list
+                    )
+            progress.update(task, description=f"Found {len(articles)} articles")
+
+            if not articles:
+                console.print("[yellow]No articles found[/yellow]")
+                return
+
+            # Save all articles first (file writes run concurrently off the event loop)
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(store.save_article, article)
+                    for article in articles
+                )
+            )
+
+            # Process articles in parallel, saving each result as it completes
+            task = progress.add_task(
+                f"Extracting from {len(articles)} articles (parallel)...",
+                total=len(articles),
+            )
+            results = pipeline.extract_batch_iter(articles, topic=None)
+            async with aclosing(results):
+                async for _, result in results:
+                    for t in result.topics:
+                        discovered_topics.add(t.name)
+                    store.save_extraction_result(result, topic=None)
+                    progress.advance(task)
+
+            progress.update(task, description=f"Processed {len(articles)} articles")
+
+        # Print summary
+        stats = store.get_stats()
+        console.print()
+        console.print("[green]Ingestion complete![/green]")
+        console.print(f"  Articles processed: {len(articles)}")
+        console.print(f"  Total articles: {stats['articles']}")
+        console.print(f"  Total events: {stats['events']}")
+        console.print(f"  Total statements: {stats['statements']}")
+        console.print(f"  Total topics: {stats['topics']}")
+        if pipeline.skipped_no_text:
+            console.print(f"  Skipped (no body text): {pipeline.skipped_no_text}")
+
+        if discovered_topics:
+            console.print()
+            console.print("[cyan]Discovered topics:[/cyan]")
+            for topic in heapq.nsmallest(15, discovered_topics):
+                console.print(f"  - {topic}")
+            if len(discovered_topics) > 15:
+                console.print(
+                    f"  ... and {len(discovered_topics) - 15} more (use 'autohistorian topics' to see all)"
+                )
+
+    run_async(run())
@@ -0,0 +1,181 @@
+"""Ingest a downloaded NYT archive month."""
+
+import asyncio
+import heapq
+from contextlib import aclosing
+from pathlib import Path
+
+import ijson
+import typer
+
+from ...config import get_settings
+from ..common import console, get_api_keys, run_async
+
+
+def ingest_archive(
+    year: int = typer.Argument(..., help="Year of archive to ingest"),
+    month: int = typer.Argument(..., help="Month of archive to ingest (1-12)"),
+    query: str | None = typer.Option(
+        None, "--query", "-q", help="Filter articles by keyword in headline/abstract"
+    ),
+    sections: str | None = typer.Option(
+        None, "--sections", "-s", help="Comma-separated sections to filter"
+    ),
+    max_articles: int = typer.Option(
+        100, "--max", "-m", help="Maximum articles to process"
+    ),
+    model: str | None = typer.Option(None, "--model", help="Gemini model to use"),
+    archive_dir: str | None = typer.Option(
+        None, "--archive-dir", help="Archive directory"
+    ),
+    data_dir: str | None = typer.Option(
+        None, "--data-dir", help="Data directory for knowledge store"
+    ),
+):
+    """Ingest articles from a local archive file into the knowledge store.
+
+    Loads articles from a previously downloaded archive and runs them through
+    the extraction pipeline to identify events, statements, and topics.
+
+    \b
+    Examples:
+        autohistorian ingest-archive 2025 12                    # All of Dec 2025
+        autohistorian ingest-archive 2025 12 -q "immigration"   # Filter by topic
+        autohistorian ingest-archive 2025 12 -s "Politics,U.S." # Filter by section
+        autohistorian ingest-archive 2025 12 -m 50              # Limit to 50 articles
+    """
+    from ...ingest.schemas import Article
+
+    _, gemini_key = get_api_keys()
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+    archive_dir = (
+        Path(archive_dir) if archive_dir else Path(settings.data_dir) / "archive"
+    )
+
+    # Load archive file
+    archive_file = archive_dir / f"{year}-{month:02d}.json"
+    if not archive_file.exists():
+        console.print(f"[red]Archive file not found: {archive_file}[/red]")
+        console.print("Run 'autohistorian crawl-archive' to download archives first.")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Loading archive: {archive_file}[/cyan]")
+
+    # Pre-compute filters once rather than per article
+    section_set = None
+    if sections:
+        section_set = frozenset(s.strip().lower() for s in sections.split(","))
+    query_lower = query.lower() if query else None
+
+    # Filter and convert articles
+    articles = []
+    skipped_empty = 0
+    # Stream records so we stop reading once max_articles have matched
+    with open(archive_file, "rb") as f:
+        for article_data in ijson.items(f, "articles.item"):
+            # Apply section filter (cheapest check first)
+            if section_set:
+                section = (article_data.get("section_name") or "").lower()
+                if section not in section_set:
+                    continue
+
+            # Skip articles with no meaningful content
+            headline_text = (article_data.get("headline") or {}).get("main", "")
+            abstract_text = article_data.get("abstract") or ""
+            if not headline_text and not abstract_text:
+                skipped_empty += 1
+                continue
+
+            # Apply query filter
+            if query_lower:
+                snippet_text = article_data.get("snippet") or ""
+                combined = f"{headline_text}\n{abstract_text}\n{snippet_text}".lower()
+                if query_lower not in combined:
+                    continue
+
+            # Archive files are written from Article.model_dump, so validate the record in one pass
+            articles.append(Article.model_validate(article_data))
+
+            if len(articles) >= max_articles:
+                break
+
+    if not articles:
+        console.print("[yellow]No articles matched the filters[/yellow]")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Found {len(articles)} articles to process[/cyan]")
+    if skipped_empty:
+        console.print(f"[dim]Skipped {skipped_empty} articles with empty content[/dim]")
+
+    async def run():
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+        )
+
+        from ...extract.pipeline import ExtractionPipeline
+        from ...knowledge.store import KnowledgeStore
+        from ...llm.cache import ResponseCache
+        from ...llm.client import GeminiClient
+
+        llm_client = GeminiClient(gemini_key, model=model or settings.gemini_model)
+        store = KnowledgeStore(data_dir)
+        cache = ResponseCache(Path(data_dir) / "llm_cache")
+        pipeline = ExtractionPipeline(llm_client, cache=cache)
+
+        discovered_topics: set[str] = set()
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            # Save all articles first (file writes run concurrently off the event loop)
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(store.save_article, article)
+                    for article in articles
+                )
+            )
+
+            # Process articles in parallel, saving each result as it completes
+            task = progress.add_task(
+                f"Extracting from {len(articles)} articles...", total=len(articles)
+            )
+            results = pipeline.extract_batch_iter(articles, topic=None)
+            async with aclosing(results):
+                async for _, result in results:
+                    for t in result.topics:
+                        discovered_topics.add(t.name)
+                    store.save_extraction_result(result, topic=None)
+                    progress.advance(task)
+
+            progress.update(task, description=f"Processed {len(articles)} articles")
+
+        # Print summary
+        stats = store.get_stats()
+        console.print()
+        console.print("[green]Ingestion complete![/green]")
+        console.print(f"  Articles processed: {len(articles)}")
+        console.print(f"  Total articles: {stats['articles']}")
+        console.print(f"  Total events: {stats['events']}")
+        console.print(f"  Total statements: {stats['statements']}")
+        console.print(f"  Total topics: {stats['topics']}")
+        if pipeline.skipped_no_text:
+            console.print(f"  Skipped (no body text): {pipeline.skipped_no_text}")
+
+        if discovered_topics:
+            console.print()
+            console.print("[cyan]Discovered topics:[/cyan]")
+            for topic in heapq.nsmallest(15, discovered_topics):
+                console.print(f"  - {topic}")
+            if len(discovered_topics) > 15:
+                console.print(f"  ... and {len(discovered_topics) - 15} more")
+
+    run_async(run())
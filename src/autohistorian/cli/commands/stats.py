@@ -0,0 +1,29 @@
+"""Show knowledge store statistics."""
+
+import typer
+
+from ...config import get_settings
+from ..common import console
+
+
+def stats(
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Data directory"),
+):
+    """Show statistics about the knowledge store."""
+    from rich.table import Table
+
+    from ...knowledge.store import KnowledgeStore
+
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+    store = KnowledgeStore(data_dir)
+    store_stats = store.get_stats()
+
+    table = Table(title="Knowledge Store Statistics")
+    table.add_column("Category", style="cyan")
+    table.add_column("Count", justify="right", style="green")
+
+    for key, value in store_stats.items():
+        table.add_row(key.capitalize(), str(value))
+
+    console.print(table)
@@ -0,0 +1,83 @@
+"""Display or export a topic timeline."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ...config import get_settings
+from ..common import console, get_api_keys
+
+
+def timeline(
+    topic: str = typer.Argument(..., help="Topic to show timeline for"),
+    format: str = typer.Option(
+        "table", "--format", "-f", help="Output format: table, json, timelinejs"
+    ),
+    valid_time: bool = typer.Option(
+        True,
+        "--valid-time/--obs-time",
+        help="Use valid time (when happened) or observation time (when reported)",
+    ),
+    output: str | None = typer.Option(None, "--output", "-o", help="Output file path"),
+    model: str | None = typer.Option(None, "--model", help="Gemini model to use"),
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Data directory"),
+):
+    """Display or export timeline for a topic."""
+    from ...knowledge.store import KnowledgeStore
+
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+    store = KnowledgeStore(data_dir)
+
+    # Check if topic exists
+    topic_names = store.get_topics()
+    if topic not in topic_names:
+        console.print(f"[yellow]Topic '{topic}' not found. Available topics:[/yellow]")
+        for t in topic_names:
+            console.print(f"  - {t}")
+        raise typer.Exit(1)
+
+    items = store.get_timeline(topic, use_valid_time=valid_time)
+
+    if format == "json":
+        output_data = json.dumps(items, indent=2)
+        if output:
+            Path(output).write_text(output_data)
+            console.print(f"[green]Timeline saved to {output}[/green]")
+        else:
+            console.print(output_data)
+
+    elif format == "timelinejs":
+        from ...llm.client import GeminiClient
+        from ...synthesize.writer import ArticleWriter
+
+        # Need LLM client for writer
+        _, gemini_key = get_api_keys()
+        llm_client = GeminiClient(gemini_key, model=model or settings.gemini_model)
+        writer = ArticleWriter(llm_client, store)
+        output_data = json.dumps(writer.export_timeline_json(topic), indent=2)
+        if output:
+            Path(output).write_text(output_data)
+            console.print(f"[green]TimelineJS data saved to {output}[/green]")
+        else:
+            console.print(output_data)
+
+    else:  # table format
+        from rich.table import Table
+
+        time_label = "When Happened" if valid_time else "When Reported"
+        table = Table(title=f"Timeline: {topic}")
+        table.add_column(time_label, style="cyan")
+        table.add_column("Type", style="magenta")
+        table.add_column("Description")
+
+        for item in items:
+            time_str = item["time"][:10] if item["time"] else "Unknown"
+            item_type = item["type"].capitalize()
+            desc = item.get("description") or item.get("content", "")
+            if len(desc) > 80:
+                desc = desc[:77] + "..."
+            table.add_row(time_str, item_type, desc)
+
+        console.print(table)
@@ -0,0 +1,66 @@
+"""List auto-discovered topics."""
+
+import typer
+
+from ...config import get_settings
+from ..common import console
+
+
+def topics(
+    category: str | None = typer.Option(
+        None, "--category", "-c", help="Filter by category"
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum topics to show"),
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Data directory"),
+):
+    """List all auto-discovered topics in the knowledge store.
+
+    Topics are automatically extracted from articles and sorted by coverage.
+    """
+    from rich.table import Table
+
+    from ...knowledge.store import KnowledgeStore
+
+    settings = get_settings()
+    data_dir = data_dir or settings.data_dir
+    store = KnowledgeStore(data_dir)
+    topics_info = store.get_all_topics_info()
+
+    if not topics_info:
+        console.print(
+            "[yellow]No topics found. Use 'autohistorian ingest' to add articles.[/yellow]"
+        )
+        return
+
+    # Filter by category if specified
+    if category:
+        topics_info = [t for t in topics_info if t["category"] == category]
+
+    # Limit results
+    topics_info = topics_info[:limit]
+
+    table = Table(title="Discovered Topics (sorted by coverage)")
+    table.add_column("Topic", style="cyan", max_width=50)
+    table.add_column("Category", style="magenta")
+    table.add_column("Articles", justify="right")
+    table.add_column("Events", justify="right")
+    table.add_column("Statements", justify="right")
+
+    for info in topics_info:
+        table.add_row(
+            info["name"],
+            info["category"],
+            str(info["article_count"]),
+            str(info["event_count"]),
+            str(info["statement_count"]),
+        )
+
+    console.print(table)
+
+    # Show available categories
+    all_topics = store.get_all_topics_info()
+    categories = {t["category"] for t in all_topics}
+    if len(categories) > 1:
+        console.print()
+        console.print(f"[dim]Categories: {', '.join(sorted(categories))}[/dim]")
+        console.print("[dim]Use --category to filter[/dim]")
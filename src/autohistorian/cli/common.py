@@ -0,0 +1,57 @@
+"""Shared helpers for CLI commands."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import typer
+from rich.console import Console
+
+from ..config import get_settings
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup, installed via the "speed" extra
+    uvloop = None
+
+T = TypeVar("T")
+
+console = Console()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:  # noqa: UP047 - also runs on 3.11
+    """Run a command's coroutine on uvloop when available, else the default loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def get_api_keys() -> tuple[str, str]:
+    """Get API keys from settings (loaded from .env or environment)."""
+    settings = get_settings()
+
+    if not settings.nyt_api_key:
+        console.print("[red]Error: AUTOHISTORIAN_NYT_API_KEY not set[/red]")
+        console.print("Set it in .env file or as environment variable")
+        raise typer.Exit(1)
+    if not settings.gemini_api_key:
+        console.print("[red]Error: AUTOHISTORIAN_GEMINI_API_KEY not set[/red]")
+        console.print("Set it in .env file or as environment variable")
+        raise typer.Exit(1)
+
+    return settings.nyt_api_key, settings.gemini_api_key
+
+
+# Available NYT sections for filtering
+NYT_SECTIONS = [
+    "U.S.",
+    "World",
+    "Politics",
+    "Business",
+    "Technology",
+    "Science",
+    "Health",
+    "Sports",
+    "Arts",
+    "Opinion",
+]
@@ -1,18 +1,16 @@
 """Configuration management for AutoHistorian."""
 
 import os
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Optional
 
-from dotenv import load_dotenv
-from pydantic import BaseModel
 
-
-class Settings(BaseModel):
+@dataclass(slots=True)
+class Settings:
     """Application settings."""
 
-    nyt_api_key: Optional[str] = None
-    gemini_api_key: Optional[str] = None
+    nyt_api_key: str | None = None
+    gemini_api_key: str | None = None
     gemini_model: str = "gemini-2.0-flash"
     data_dir: str = "data"
 
@@ -20,11 +18,16 @@ class Settings(BaseModel):
 @lru_cache
 def get_settings() -> Settings:
     """Load settings from environment variables."""
-    load_dotenv()
+    # Values already exported in the environment take precedence over .env
+    from dotenv import load_dotenv
+
+    load_dotenv(override=False)
 
     return Settings(
         nyt_api_key=os.getenv("NYT_API_KEY") or os.getenv("AUTOHISTORIAN_NYT_API_KEY"),
-        gemini_api_key=os.getenv("GEMINI_API_KEY") or os.getenv("AUTOHISTORIAN_GEMINI_API_KEY"),
-        gemini_model=os.getenv("GEMINI_MODEL") or os.getenv("AUTOHISTORIAN_GEMINI_MODEL", "gemini-2.0-flash"),
+        gemini_api_key=os.getenv("GEMINI_API_KEY")
+        or os.getenv("AUTOHISTORIAN_GEMINI_API_KEY"),
+        gemini_model=os.getenv("GEMINI_MODEL")
+        or os.getenv("AUTOHISTORIAN_GEMINI_MODEL", "gemini-2.0-flash"),
         data_dir=os.getenv("DATA_DIR") or os.getenv("AUTOHISTORIAN_DATA_DIR", "data"),
     )
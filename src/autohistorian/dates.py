@@ -0,0 +1,27 @@
+"""Memoized parsing of ISO timestamps."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+
+def parse_iso_datetime(value: Any) -> datetime | None:
+    """Parse an ISO datetime string, or return None if it is missing or malformed.
+
+    Used for NYT pub_dates and LLM-reported event times; both repeat the
+    same timestamps across many records, so each distinct string is parsed
+    once.
+    """
+    # Checked before the cache, which can't hash odd values such as dicts
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_iso_string(value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_string(value: str) -> datetime | None:
+    # fromisoformat accepts "Z" and "+0000" offsets on 3.11+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
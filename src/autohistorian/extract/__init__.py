@@ -1,15 +1,44 @@
 """Extraction modules for events, statements, entities, and topics."""
 
-from .entity_extractor import EntityExtractor
-from .event_extractor import EventExtractor
-from .pipeline import ExtractionPipeline
-from .statement_extractor import StatementExtractor
-from .topic_extractor import TopicExtractor
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import SemanticExtractCache
+    from .entity_extractor import EntityExtractor
+    from .event_extractor import EventExtractor
+    from .pipeline import ExtractionPipeline
+    from .statement_extractor import StatementExtractor
+    from .topic_extractor import TopicExtractor
+
+# Extractors pull in the Gemini SDK, so only import them when accessed
+_LAZY = {
+    "EntityExtractor": ".entity_extractor",
+    "EventExtractor": ".event_extractor",
+    "ExtractionPipeline": ".pipeline",
+    "SemanticExtractCache": ".cache",
+    "StatementExtractor": ".statement_extractor",
+    "TopicExtractor": ".topic_extractor",
+}
 
 __all__ = [
     "EntityExtractor",
     "EventExtractor",
     "ExtractionPipeline",
+    "SemanticExtractCache",
     "StatementExtractor",
     "TopicExtractor",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
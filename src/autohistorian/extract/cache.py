@@ -0,0 +1,198 @@
+"""Near-duplicate aware cache of combined extraction results."""
+
+import json
+import os
+import re
+import zlib
+
+from ..llm.cache import ResponseCache
+
+_WORD_RE = re.compile(r"\w+")
+
+# MinHash parameters: NUM_BANDS * ROWS_PER_BAND hash functions
+_NUM_BANDS = 16
+_ROWS_PER_BAND = 4
+_NUM_HASHES = _NUM_BANDS * _ROWS_PER_BAND
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_HASH_PARAMS = [
+    (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+    for i in range(_NUM_HASHES)
+]
+
+
+def _shingles(text: str, size: int = 3) -> set[int]:
+    """Hash the word n-grams of a text after lowercasing and stripping punctuation."""
+    words = _WORD_RE.findall(text.lower())
+    return {
+        zlib.crc32(" ".join(words[i : i + size]).encode())
+        for i in range(len(words) - size + 1)
+    }
+
+
+def _signature(shingles: set[int]) -> list[int]:
+    """Compute a MinHash signature for a set of shingle hashes."""
+    return [
+        min((a * s + b) % _PRIME & _MAX_HASH for s in shingles) for a, b in _HASH_PARAMS
+    ]
+
+
+class SemanticExtractCache:
+    """Cache of combined extraction results that also matches near-duplicate articles.
+
+    Lookups try the exact text first, then fall back to MinHash/LSH over word
+    shingles so lightly edited reprints (wire copies, updated versions of the
+    same story) reuse an existing result. Results are stored as the raw LLM
+    output and rebuilt for each article, so IDs never leak between articles.
+    """
+
+    INDEX_FILE = "near_duplicates.jsonl"
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        namespace: str,
+        threshold: float = 0.9,
+        min_shingles: int = 20,
+    ):
+        """Initialize the extraction cache.
+
+        Args:
+            cache: Response cache holding the results
+            namespace: Prefix for cache keys, usually the model name
+            threshold: Minimum estimated Jaccard similarity for a near-duplicate hit
+            min_shingles: Texts with fewer shingles only match exactly
+        """
+        self.cache = cache
+        self.namespace = namespace
+        self.threshold = threshold
+        self.min_shingles = min_shingles
+        self._index_path = cache.cache_dir / self.INDEX_FILE
+        self._signatures: dict[str, list[int]] | None = None
+        self._buckets: dict[tuple, list[str]] = {}
+
+    def _key(self, text: str) -> str:
+        return self.cache.make_key(self.namespace, "all", text)
+
+    def _load_index(self) -> dict[str, list[int]]:
+        """Read stored signatures for this namespace on first use.
+
+        Entries whose cached result has expired (along with duplicate and
+        unreadable lines) are dropped and the index file is rewritten without
+        them, so it stays in step with the response cache's TTL.
+        """
+        if self._signatures is None:
+            self._signatures = {}
+            kept: dict[str, str] = {}
+            stale = False
+            try:
+                with open(self._index_path) as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            key = record["key"]
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            stale = True
+                            continue
+                        if key in kept or not self.cache.has(key):
+                            stale = True
+                            continue
+                        kept[key] = line if line.endswith("\n") else line + "\n"
+                        if record.get("ns") == self.namespace:
+                            self._add_signature(key, record["sig"])
+            except OSError:
+                pass
+            if stale:
+                self._rewrite_index(list(kept.values()))
+        return self._signatures
+
+    def _rewrite_index(self, lines: list[str]) -> None:
+        """Replace the index file with the given lines."""
+        tmp_path = self._index_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text("".join(lines))
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            # Compaction is best effort; the stale lines are skipped next time too
+            pass
+
+    def _add_signature(self, key: str, signature: list[int]) -> None:
+        self._signatures[key] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(key)
+
+    def _remove_signature(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band in self._bands(signature):
+            bucket = self._buckets.get(band)
+            if bucket is not None and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    @staticmethod
+    def _bands(signature: list[int]) -> list[tuple]:
+        return [
+            (i, *signature[i * _ROWS_PER_BAND : (i + 1) * _ROWS_PER_BAND])
+            for i in range(_NUM_BANDS)
+        ]
+
+    def _text_signature(self, text: str) -> list[int] | None:
+        shingles = _shingles(text)
+        if len(shingles) < self.min_shingles:
+            return None
+        return _signature(shingles)
+
+    def get(self, text: str) -> dict | None:
+        """Return the cached result for a text or a near-duplicate of it."""
+        exact = self.cache.get(self._key(text))
+        if exact is not None:
+            return exact
+
+        signature = self._text_signature(text)
+        if signature is None:
+            return None
+
+        signatures = self._load_index()
+        candidates = {
+            key
+            for band in self._bands(signature)
+            for key in self._buckets.get(band, ())
+        }
+
+        # Verify LSH candidates against the full signature, best match first
+        scored = []
+        for key in candidates:
+            stored = signatures[key]
+            similarity = sum(x == y for x, y in zip(signature, stored)) / _NUM_HASHES
+            if similarity >= self.threshold:
+                scored.append((similarity, key))
+
+        for _, key in sorted(scored, reverse=True):
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            # Expired since the index was loaded; stop scoring it
+            self._remove_signature(key)
+        return None
+
+    def put(self, text: str, raw: dict) -> None:
+        """Store a result and index the text for near-duplicate lookups."""
+        key = self._key(text)
+        self.cache.put(key, raw)
+
+        # Empty results aren't cached, so there is nothing to point at
+        signatures = self._load_index()
+        if key in signatures or not any(raw.values()):
+            return
+        signature = self._text_signature(text)
+        if signature is None:
+            return
+
+        self._add_signature(key, signature)
+        with open(self._index_path, "a") as f:
+            f.write(
+                json.dumps({"ns": self.namespace, "key": key, "sig": signature}) + "\n"
+            )
@@ -1,31 +1,25 @@
 """Entity extraction from articles."""
 
-from uuid import uuid4
-
+from ..ids import uuid7_batch
 from ..ingest.schemas import Article
+from ..interning import intern_str
 from ..knowledge.models import Entity
+from ..llm.cache import ResponseCache
 from ..llm.client import GeminiClient
 
 
 class EntityExtractor:
     """Extract entities from articles using LLM."""
 
-    def __init__(self, llm_client: GeminiClient):
+    def __init__(self, llm_client: GeminiClient, cache: ResponseCache | None = None):
         """Initialize the entity extractor.
 
         Args:
             llm_client: Gemini client for LLM calls
+            cache: Optional cache of LLM results keyed by article text
         """
         self.llm_client = llm_client
-
-    def _build_article_text(self, article: Article) -> str:
-        """Build article text for extraction."""
-        parts = [f"Headline: {article.headline.main}"]
-        if article.abstract:
-            parts.append(f"Abstract: {article.abstract}")
-        if article.lead_paragraph:
-            parts.append(f"Lead: {article.lead_paragraph}")
-        return "\n\n".join(parts)
+        self.cache = cache
 
     async def extract(self, article: Article) -> list[Entity]:
         """Extract entities from an article.
@@ -36,18 +30,40 @@ class EntityExtractor:
         Returns:
             List of Entity objects
         """
-        article_text = self._build_article_text(article)
+        # A headline alone rarely yields anything worth an LLM call
+        if not article.has_text:
+            return []
+
+        article_text = article.extraction_text
+
+        # Extract entities using LLM (or reuse a cached result)
+        if self.cache is not None:
+            key = self.cache.make_key(self.llm_client.model, "entities", article_text)
+            raw_entities = await self.cache.get_or_fetch(
+                key, lambda: self.llm_client.extract_entities(article_text)
+            )
+        else:
+            raw_entities = await self.llm_client.extract_entities(article_text)
+
+        return self.from_raw(article, raw_entities)
 
-        # Extract entities using LLM
-        raw_entities = await self.llm_client.extract_entities(article_text)
+    def from_raw(self, article: Article, raw_entities: list[dict]) -> list[Entity]:
+        """Convert raw LLM entities for an article into Entity models.
 
+        Args:
+            article: The article the entities were extracted from
+            raw_entities: Entity dictionaries returned by the LLM
+
+        Returns:
+            List of Entity objects
+        """
         # Convert to Entity models
         entities = []
-        for raw in raw_entities:
+        for item_id, raw in zip(uuid7_batch(len(raw_entities)), raw_entities):
             entity = Entity(
-                id=uuid4(),
+                id=item_id,
                 name=raw.get("name", ""),
-                entity_type=raw.get("entity_type", "unknown"),
+                entity_type=intern_str(raw.get("entity_type", "unknown")),
                 description=raw.get("description"),
             )
             entities.append(entity)
@@ -1,41 +1,26 @@
 """Event extraction from articles."""
 
-from datetime import datetime
-from uuid import uuid4
-
+from ..dates import parse_iso_datetime
+from ..ids import uuid7_batch
 from ..ingest.schemas import Article
+from ..interning import intern_str
 from ..knowledge.models import Event
+from ..llm.cache import ResponseCache
 from ..llm.client import GeminiClient
 
 
 class EventExtractor:
     """Extract events from articles using LLM."""
 
-    def __init__(self, llm_client: GeminiClient):
+    def __init__(self, llm_client: GeminiClient, cache: ResponseCache | None = None):
         """Initialize the event extractor.
 
         Args:
             llm_client: Gemini client for LLM calls
+            cache: Optional cache of LLM results keyed by article text
         """
         self.llm_client = llm_client
-
-    def _build_article_text(self, article: Article) -> str:
-        """Build article text for extraction."""
-        parts = [f"Headline: {article.headline.main}"]
-        if article.abstract:
-            parts.append(f"Abstract: {article.abstract}")
-        if article.lead_paragraph:
-            parts.append(f"Lead: {article.lead_paragraph}")
-        return "\n\n".join(parts)
-
-    def _parse_datetime(self, date_str: str) -> datetime | None:
-        """Parse a datetime string."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            return None
+        self.cache = cache
 
     async def extract(self, article: Article) -> list[Event]:
         """Extract events from an article.
@@ -46,19 +31,41 @@ class EventExtractor:
         Returns:
             List of Event objects
         """
-        article_text = self._build_article_text(article)
+        # A headline alone rarely yields anything worth an LLM call
+        if not article.has_text:
+            return []
+
+        article_text = article.extraction_text
+
+        # Extract events using LLM (or reuse a cached result)
+        if self.cache is not None:
+            key = self.cache.make_key(self.llm_client.model, "events", article_text)
+            raw_events = await self.cache.get_or_fetch(
+                key, lambda: self.llm_client.extract_events(article_text)
+            )
+        else:
+            raw_events = await self.llm_client.extract_events(article_text)
 
-        # Extract events using LLM
-        raw_events = await self.llm_client.extract_events(article_text)
+        return self.from_raw(article, raw_events)
 
+    def from_raw(self, article: Article, raw_events: list[dict]) -> list[Event]:
+        """Convert raw LLM events for an article into Event models.
+
+        Args:
+            article: The article the events were extracted from
+            raw_events: Event dictionaries returned by the LLM
+
+        Returns:
+            List of Event objects
+        """
         # Convert to Event models
         events = []
-        for raw in raw_events:
+        for item_id, raw in zip(uuid7_batch(len(raw_events)), raw_events):
             event = Event(
-                id=uuid4(),
+                id=item_id,
                 description=raw.get("description", ""),
-                event_type=raw.get("event_type", "unknown"),
-                valid_time=self._parse_datetime(raw.get("valid_time")),
+                event_type=intern_str(raw.get("event_type", "unknown")),
+                valid_time=parse_iso_datetime(raw.get("valid_time")),
                 observation_time=article.pub_date,  # When the article was published
                 participants=raw.get("participants", []),
                 location=raw.get("location"),
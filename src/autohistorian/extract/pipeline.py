@@ -1,11 +1,14 @@
 """Extraction pipeline for processing articles."""
 
 import asyncio
-from typing import Optional
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 from ..ingest.schemas import Article
-from ..knowledge.models import ExtractionResult, ExtractedTopic
+from ..knowledge.models import ExtractedTopic, ExtractionResult
+from ..llm.cache import ResponseCache
 from ..llm.client import GeminiClient
+from .cache import SemanticExtractCache
 from .entity_extractor import EntityExtractor
 from .event_extractor import EventExtractor
 from .statement_extractor import StatementExtractor
@@ -15,20 +18,31 @@ from .topic_extractor import TopicExtractor
 class ExtractionPipeline:
     """Pipeline for extracting structured data from articles."""
 
-    def __init__(self, llm_client: GeminiClient):
+    # (max approx tokens, articles per request) for length-binned batching;
+    # longer articles go one per request
+    LENGTH_BINS = ((256, 6), (1024, 4), (4096, 2))
+
+    def __init__(self, llm_client: GeminiClient, cache: ResponseCache | None = None):
         """Initialize the extraction pipeline.
 
         Args:
             llm_client: Gemini client for LLM calls
+            cache: Optional cache of LLM results shared by all extractors
         """
         self.llm_client = llm_client
-        self.event_extractor = EventExtractor(llm_client)
-        self.statement_extractor = StatementExtractor(llm_client)
-        self.entity_extractor = EntityExtractor(llm_client)
-        self.topic_extractor = TopicExtractor(llm_client)
+        self.cache = cache
+        # Articles skipped without an LLM call because they had no body text
+        self.skipped_no_text = 0
+        self.result_cache = (
+            SemanticExtractCache(cache, llm_client.model) if cache is not None else None
+        )
+        self.event_extractor = EventExtractor(llm_client, cache)
+        self.statement_extractor = StatementExtractor(llm_client, cache)
+        self.entity_extractor = EntityExtractor(llm_client, cache)
+        self.topic_extractor = TopicExtractor(llm_client, cache)
 
     async def extract(
-        self, article: Article, topic: Optional[str] = None
+        self, article: Article, topic: str | None = None
     ) -> ExtractionResult:
         """Extract all information from an article.
 
@@ -39,33 +53,41 @@ class ExtractionPipeline:
         Returns:
             ExtractionResult with events, statements, entities, and topics
         """
-        # Determine if we should auto-detect topics
-        auto_topics = topic is None
-        topics = []
-
-        if auto_topics:
-            # Run topic and entity extraction in parallel
-            topics_task = self.topic_extractor.extract_topics(article)
-            entities_task = self.entity_extractor.extract(article)
-            raw_topics, entities = await asyncio.gather(topics_task, entities_task)
-
-            topics = [
-                ExtractedTopic(
-                    name=t.get("name", "Unknown"),
-                    category=t.get("category", "other"),
-                    relevance=t.get("relevance", 1.0),
-                )
-                for t in raw_topics
-            ]
+        if not article.has_text:
+            self.skipped_no_text += 1
+            return ExtractionResult(article_id=article.id)
+
+        article_text = article.extraction_text
+
+        # One LLM call covers all four tasks; the extractors convert each part
+        raw = (
+            self.result_cache.get(article_text)
+            if self.result_cache is not None
+            else None
+        )
+        if raw is None:
+            raw = await self.llm_client.extract_all(article_text)
+            if self.result_cache is not None:
+                self.result_cache.put(article_text, raw)
+
+        return self._build_result(article, raw, topic)
+
+    def _build_result(
+        self, article: Article, raw: dict, topic: str | None = None
+    ) -> ExtractionResult:
+        """Convert a combined raw extraction into an ExtractionResult."""
+        events = self.event_extractor.from_raw(article, raw.get("events", []))
+        statements = self.statement_extractor.from_raw(
+            article, raw.get("statements", [])
+        )
+        entities = self.entity_extractor.from_raw(article, raw.get("entities", []))
+
+        # Auto-detect topics unless one was given
+        if topic is None:
+            topics = self.topic_extractor.from_raw(raw.get("topics", []))
         else:
-            entities = await self.entity_extractor.extract(article)
             topics = [ExtractedTopic(name=topic, category="other", relevance=1.0)]
 
-        # Extract events and statements in parallel
-        events_task = self.event_extractor.extract(article)
-        statements_task = self.statement_extractor.extract(article)
-        events, statements = await asyncio.gather(events_task, statements_task)
-
         return ExtractionResult(
             article_id=article.id,
             events=events,
@@ -74,27 +96,283 @@ class ExtractionPipeline:
             topics=topics,
         )
 
+    async def _extract_group(
+        self, articles: list[Article], topic: str | None = None
+    ) -> list[ExtractionResult]:
+        """Extract a group of articles, sending all cache misses in one LLM call.
+
+        Articles the batched response doesn't cover are retried individually,
+        and articles without body text get an empty result with no LLM call.
+        """
+        texts = [article.extraction_text for article in articles]
+        raws: list[dict | None] = [None] * len(articles)
+
+        with_text = [i for i, article in enumerate(articles) if article.has_text]
+        self.skipped_no_text += len(articles) - len(with_text)
+
+        if self.result_cache is not None:
+            for i in with_text:
+                raws[i] = self.result_cache.get(texts[i])
+
+        missing = [i for i in with_text if raws[i] is None]
+        if missing:
+            fetched = await self.llm_client.batch_extract_all(
+                [texts[i] for i in missing]
+            )
+            for i, raw in zip(missing, fetched):
+                raws[i] = raw
+
+            # Retry the articles the batch reply skipped concurrently
+            retry = [i for i in missing if raws[i] is None]
+            if retry:
+                retried = await asyncio.gather(
+                    *(self.llm_client.extract_all(texts[i]) for i in retry)
+                )
+                for i, raw in zip(retry, retried):
+                    raws[i] = raw
+
+            if self.result_cache is not None:
+                for i in missing:
+                    self.result_cache.put(texts[i], raws[i])
+
+        return [
+            self._build_result(article, raw, topic)
+            if raw is not None
+            else ExtractionResult(article_id=article.id)
+            for article, raw in zip(articles, raws)
+        ]
+
+    def _group_size(self, article: Article) -> int:
+        """Articles per request for this article's length bin (~4 chars per token)."""
+        approx_tokens = len(article.extraction_text) // 4
+        return next(
+            (size for limit, size in self.LENGTH_BINS if approx_tokens < limit), 1
+        )
+
+    def _group_articles(
+        self, articles: list[Article], batch_size: int | None = None
+    ) -> list[list[int]]:
+        """Split article indices into request groups.
+
+        By default articles are binned by estimated length (~4 chars per
+        token) so short articles batch together and never wait behind long
+        ones; each bin uses its own group size from LENGTH_BINS. A fixed
+        batch_size disables binning.
+        """
+        if batch_size is not None:
+            return [
+                list(range(start, min(start + batch_size, len(articles))))
+                for start in range(0, len(articles), batch_size)
+            ]
+
+        bins: dict[int, list[int]] = {}
+        for index, article in enumerate(articles):
+            bins.setdefault(self._group_size(article), []).append(index)
+
+        return [
+            indices[start : start + size]
+            for size, indices in bins.items()
+            for start in range(0, len(indices), size)
+        ]
+
+    async def _iter_groups(
+        self,
+        articles: list[Article],
+        topic: str | None,
+        max_concurrent: int,
+        batch_size: int | None,
+    ) -> AsyncIterator[list[tuple[int, Article, ExtractionResult]]]:
+        """Run article groups concurrently, yielding each group as it completes."""
+        # Register the shared system prompt once so each call can reference it
+        await self.llm_client.ensure_prompt_cache()
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def extract_with_semaphore(
+            indices: list[int],
+        ) -> list[tuple[int, Article, ExtractionResult]]:
+            group = [articles[i] for i in indices]
+            async with semaphore:
+                results = await self._extract_group(group, topic)
+            return list(zip(indices, group, results))
+
+        tasks = [
+            asyncio.create_task(extract_with_semaphore(indices))
+            for indices in self._group_articles(articles, batch_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Wait for cancelled groups to unwind instead of leaving them pending
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def extract_batch(
         self,
         articles: list[Article],
-        topic: Optional[str] = None,
+        topic: str | None = None,
         max_concurrent: int = 5,
+        batch_size: int | None = None,
     ) -> list[ExtractionResult]:
-        """Extract from multiple articles with concurrency control.
+        """Extract from multiple articles with batching and concurrency control.
+
+        Articles are grouped by length into multi-article LLM requests.
 
         Args:
             articles: List of articles to process
             topic: Optional topic to focus on
-            max_concurrent: Maximum concurrent extractions
+            max_concurrent: Maximum concurrent LLM requests
+            batch_size: Fixed articles per LLM request (default: size by length)
 
         Returns:
-            List of ExtractionResult objects
+            List of ExtractionResult objects, in input order
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        results: list[ExtractionResult | None] = [None] * len(articles)
+        groups = self._iter_groups(articles, topic, max_concurrent, batch_size)
+        async with aclosing(groups):
+            async for group in groups:
+                for index, _, result in group:
+                    results[index] = result
+        return results
 
-        async def extract_with_semaphore(article: Article) -> ExtractionResult:
-            async with semaphore:
-                return await self.extract(article, topic)
+    async def extract_batch_iter(
+        self,
+        articles: list[Article],
+        topic: str | None = None,
+        max_concurrent: int = 5,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[tuple[Article, ExtractionResult]]:
+        """Extract from multiple articles, yielding results as each batch completes.
+
+        Lets callers save or report results while the remaining extractions
+        are still running. Iterate under contextlib.aclosing so stopping early
+        cancels the in-flight requests straight away.
+
+        Args:
+            articles: List of articles to process
+            topic: Optional topic to focus on
+            max_concurrent: Maximum concurrent LLM requests
+            batch_size: Fixed articles per LLM request (default: size by length)
+
+        Yields:
+            (article, result) tuples in completion order
+        """
+        groups = self._iter_groups(articles, topic, max_concurrent, batch_size)
+        async with aclosing(groups):
+            async for group in groups:
+                for _, article, result in group:
+                    yield article, result
+
+    async def extract_stream(
+        self,
+        articles: AsyncIterator[Article],
+        topic: str | None = None,
+        max_concurrent: int = 5,
+        flush_interval: float = 2.0,
+    ) -> AsyncIterator[tuple[Article, ExtractionResult]]:
+        """Extract from an async stream of articles, yielding results as they complete.
+
+        Articles are buffered per length bin and sent as soon as a bin is
+        full, or after flush_interval seconds so a slow source doesn't hold
+        back a partial group. Every stage is connected by a bounded queue, so
+        a slow consumer pauses extraction and extraction pauses the source;
+        memory stays constant however many articles the stream produces.
+
+        Args:
+            articles: Async iterator of articles, e.g. NYTClient.stream_archive_range
+            topic: Optional topic to focus on
+            max_concurrent: Maximum concurrent LLM requests
+            flush_interval: Seconds a partial group may wait for more articles
+
+        Yields:
+            (article, result) pairs in completion order
+        """
+        await self.llm_client.ensure_prompt_cache()
+
+        max_group = max(size for _, size in self.LENGTH_BINS)
+        incoming: asyncio.Queue[Article | None] = asyncio.Queue(
+            max_concurrent * max_group
+        )
+        groups: asyncio.Queue[list[Article] | None] = asyncio.Queue(max_concurrent)
+        # Results are unbounded in the queue itself but capped by slots, which
+        # the consumer releases, so the end marker can always be queued
+        outgoing: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(max_concurrent * max_group)
+        done = object()
+
+        async def read() -> None:
+            async for article in articles:
+                await incoming.put(article)
+            await incoming.put(None)
+
+        async def batch() -> None:
+            loop = asyncio.get_running_loop()
+            # group size -> (buffered articles, flush deadline)
+            buffers: dict[int, tuple[list[Article], float]] = {}
+
+            while True:
+                timeout = None
+                if buffers:
+                    timeout = max(
+                        0.0, min(d for _, d in buffers.values()) - loop.time()
+                    )
+                # asyncio.timeout rather than wait_for, which can swallow a
+                # cancellation that races the get() completing
+                try:
+                    async with asyncio.timeout(timeout):
+                        article = await incoming.get()
+                except TimeoutError:
+                    pass  # a partial group has waited long enough
+                else:
+                    if article is None:
+                        break
+                    size = self._group_size(article)
+                    buffers.setdefault(size, ([], loop.time() + flush_interval))[
+                        0
+                    ].append(article)
+
+                now = loop.time()
+                for size in [
+                    s for s, (b, d) in buffers.items() if len(b) >= s or d <= now
+                ]:
+                    await groups.put(buffers.pop(size)[0])
+
+            for buffered, _ in buffers.values():
+                await groups.put(buffered)
+            for _ in range(max_concurrent):
+                await groups.put(None)
+
+        async def work() -> None:
+            while (group := await groups.get()) is not None:
+                results = await self._extract_group(group, topic)
+                for pair in zip(group, results):
+                    await slots.acquire()
+                    outgoing.put_nowait(pair)
+
+        async def run() -> None:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(read())
+                    tg.create_task(batch())
+                    for _ in range(max_concurrent):
+                        tg.create_task(work())
+            except* Exception as group_error:
+                # Surface the first stage error, chained to the whole group;
+                # KeyboardInterrupt and cancellation propagate unchanged
+                raise group_error.exceptions[0] from group_error
+            finally:
+                outgoing.put_nowait(done)
 
-        tasks = [extract_with_semaphore(article) for article in articles]
-        return await asyncio.gather(*tasks)
+        runner = asyncio.create_task(run())
+        try:
+            while (item := await outgoing.get()) is not done:
+                yield item
+                slots.release()
+            # Re-raise any error from the stages
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
+                await asyncio.wait([runner])
@@ -1,31 +1,24 @@
 """Statement extraction from articles."""
 
-from uuid import uuid4
-
+from ..ids import uuid7_batch
 from ..ingest.schemas import Article
 from ..knowledge.models import Statement
+from ..llm.cache import ResponseCache
 from ..llm.client import GeminiClient
 
 
 class StatementExtractor:
     """Extract statements and quotes from articles using LLM."""
 
-    def __init__(self, llm_client: GeminiClient):
+    def __init__(self, llm_client: GeminiClient, cache: ResponseCache | None = None):
         """Initialize the statement extractor.
 
         Args:
             llm_client: Gemini client for LLM calls
+            cache: Optional cache of LLM results keyed by article text
         """
         self.llm_client = llm_client
-
-    def _build_article_text(self, article: Article) -> str:
-        """Build article text for extraction."""
-        parts = [f"Headline: {article.headline.main}"]
-        if article.abstract:
-            parts.append(f"Abstract: {article.abstract}")
-        if article.lead_paragraph:
-            parts.append(f"Lead: {article.lead_paragraph}")
-        return "\n\n".join(parts)
+        self.cache = cache
 
     async def extract(self, article: Article) -> list[Statement]:
         """Extract statements from an article.
@@ -36,16 +29,38 @@ class StatementExtractor:
         Returns:
             List of Statement objects
         """
-        article_text = self._build_article_text(article)
+        # A headline alone rarely yields anything worth an LLM call
+        if not article.has_text:
+            return []
+
+        article_text = article.extraction_text
+
+        # Extract statements using LLM (or reuse a cached result)
+        if self.cache is not None:
+            key = self.cache.make_key(self.llm_client.model, "statements", article_text)
+            raw_statements = await self.cache.get_or_fetch(
+                key, lambda: self.llm_client.extract_statements(article_text)
+            )
+        else:
+            raw_statements = await self.llm_client.extract_statements(article_text)
+
+        return self.from_raw(article, raw_statements)
 
-        # Extract statements using LLM
-        raw_statements = await self.llm_client.extract_statements(article_text)
+    def from_raw(self, article: Article, raw_statements: list[dict]) -> list[Statement]:
+        """Convert raw LLM statements for an article into Statement models.
 
+        Args:
+            article: The article the statements were extracted from
+            raw_statements: Statement dictionaries returned by the LLM
+
+        Returns:
+            List of Statement objects
+        """
         # Convert to Statement models
         statements = []
-        for raw in raw_statements:
+        for item_id, raw in zip(uuid7_batch(len(raw_statements)), raw_statements):
             statement = Statement(
-                id=uuid4(),
+                id=item_id,
                 content=raw.get("content", ""),
                 speaker=raw.get("speaker") or "Unknown",
                 speaker_role=raw.get("speaker_role"),
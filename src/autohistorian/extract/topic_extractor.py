@@ -1,20 +1,34 @@
 """Topic extraction from articles."""
 
 from ..ingest.schemas import Article
+from ..interning import intern_str
+from ..knowledge.models import ExtractedTopic
+from ..llm.cache import ResponseCache
 from ..llm.client import GeminiClient
-from ..llm.prompts import TOPIC_EXTRACTION_PROMPT
+from ..llm.prompts import TOPIC_EXTRACTION_ARTICLE, TOPIC_EXTRACTION_PREFIX
+from ..llm.schemas import TOPIC_LIST_SCHEMA
 
 
 class TopicExtractor:
     """Extract topics from articles using LLM."""
 
-    def __init__(self, llm_client: GeminiClient):
+    def __init__(self, llm_client: GeminiClient, cache: ResponseCache | None = None):
         """Initialize the topic extractor.
 
         Args:
             llm_client: Gemini client for LLM calls
+            cache: Optional cache of LLM results keyed by prompt
         """
         self.llm_client = llm_client
+        self.cache = cache
+
+    async def _fetch_topics(self, prompt: str) -> list[dict]:
+        """Run the topic prompt and parse the JSON response."""
+        result = await self.llm_client._generate_json(prompt, TOPIC_LIST_SCHEMA)
+
+        if isinstance(result, list):
+            return result
+        return []
 
     async def extract_topics(self, article: Article) -> list[dict]:
         """Extract topics from an article.
@@ -25,14 +39,35 @@ class TopicExtractor:
         Returns:
             List of topic dictionaries with name, category, and relevance
         """
-        prompt = TOPIC_EXTRACTION_PROMPT.format(
+        if not article.has_text:
+            return []
+
+        prompt = TOPIC_EXTRACTION_PREFIX + TOPIC_EXTRACTION_ARTICLE.format(
             headline=article.headline.main,
             abstract=article.abstract or article.snippet or "",
         )
 
-        response = await self.llm_client._generate(prompt)
-        result = self.llm_client._extract_json(response)
+        if self.cache is not None:
+            key = self.cache.make_key(self.llm_client.model, "topics", prompt)
+            return await self.cache.get_or_fetch(
+                key, lambda: self._fetch_topics(prompt)
+            )
+        return await self._fetch_topics(prompt)
 
-        if isinstance(result, list):
-            return result
-        return []
+    def from_raw(self, raw_topics: list[dict]) -> list[ExtractedTopic]:
+        """Convert raw LLM topics into ExtractedTopic models.
+
+        Args:
+            raw_topics: Topic dictionaries returned by the LLM
+
+        Returns:
+            List of ExtractedTopic objects
+        """
+        return [
+            ExtractedTopic(
+                name=t.get("name", "Unknown"),
+                category=intern_str(t.get("category", "other")),
+                relevance=t.get("relevance", 1.0),
+            )
+            for t in raw_topics
+        ]
@@ -3,4 +3,4 @@
 from .nyt_client import NYTClient
 from .schemas import ArchiveResponse, Article, ArticleSearchResponse
 
-__all__ = ["NYTClient", "ArchiveResponse", "Article", "ArticleSearchResponse"]
+__all__ = ["ArchiveResponse", "Article", "ArticleSearchResponse", "NYTClient"]
@@ -1,20 +1,60 @@
 """NYT Article Search API client."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional
-from uuid import uuid4
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from typing import Any, Self
+from uuid import UUID, uuid4
 
 import httpx
+import ijson
+import orjson
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticUndefined
 
-from .schemas import (
-    ArchiveResponse,
-    Article,
-    ArticleSearchResponse,
-    Byline,
-    Headline,
-    Keyword,
-)
+from ..dates import parse_iso_datetime
+from ..ids import uuid7_batch
+from ..interning import intern_str
+from .schemas import ArchiveResponse, Article, ArticleSearchResponse, Byline, Headline
+
+# Nested models whose fields are reset one at a time when a doc is invalid
+_NESTED_MODELS: dict[str, type[BaseModel]] = {"headline": Headline, "byline": Byline}
+
+
+def _field_default(model: type[BaseModel], name: str) -> Any:
+    """Default for a model field; required string fields fall back to ""."""
+    default = model.model_fields[name].get_default(call_default_factory=True)
+    return "" if default is PydanticUndefined else default
+
+
+def _reset_invalid_fields(data: dict, error: ValidationError) -> None:
+    """Reset the fields of an article dict that failed validation.
+
+    Bad keywords are dropped individually, bad headline and byline fields are
+    reset within their nested dict, and any other bad field takes the
+    Article default (e.g. a null word_count becomes 0).
+    """
+    bad_keywords = set()
+    for detail in error.errors():
+        field, *rest = detail["loc"]
+        if field == "keywords" and rest:
+            bad_keywords.add(rest[0])
+        elif (
+            field in _NESTED_MODELS
+            and rest
+            and rest[0] in _NESTED_MODELS[field].model_fields
+        ):
+            data[field][rest[0]] = _field_default(_NESTED_MODELS[field], rest[0])
+        else:
+            data[field] = _field_default(Article, field)
+    if bad_keywords:
+        data["keywords"] = [
+            keyword
+            for i, keyword in enumerate(data["keywords"])
+            if i not in bad_keywords
+        ]
 
 
 class NYTClient:
@@ -25,85 +65,140 @@ class NYTClient:
 
     BASE_URL = "https://api.nytimes.com/svc/search/v2/articlesearch.json"
     ARCHIVE_URL = "https://api.nytimes.com/svc/archive/v1/{year}/{month}.json"
-    RATE_LIMIT_DELAY = 12.0  # NYT allows 5 requests per minute
+    RATE_LIMIT_WINDOW = 60.0  # NYT allows 5 requests per minute
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, requests_per_minute: int = 5):
         """Initialize the NYT client.
 
         Args:
             api_key: NYT API key from https://developer.nytimes.com/
+            requests_per_minute: Request budget per rolling minute (5 on the free tier)
         """
         self.api_key = api_key
-        self._last_request_time: Optional[float] = None
+        self.requests_per_minute = requests_per_minute
+        self._request_times: deque[float] = deque()
+        self._rate_limit_lock = asyncio.Lock()
+        # One pooled HTTP/2 client for all requests, so connections are reused
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        if self._last_request_time is not None:
-            elapsed = asyncio.get_event_loop().time() - self._last_request_time
-            if elapsed < self.RATE_LIMIT_DELAY:
-                await asyncio.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = asyncio.get_event_loop().time()
-
-    def _parse_article(self, doc: dict) -> Article:
-        """Parse a document from the NYT API response into an Article."""
-        headline_data = doc.get("headline", {})
-        headline = Headline(
-            main=headline_data.get("main", ""),
-            print_headline=headline_data.get("print_headline"),
-        )
+        """Wait until a request fits in the rolling per-minute budget.
 
-        byline_data = doc.get("byline")
-        byline = None
+        Up to requests_per_minute requests start immediately; after that each
+        new request waits until the oldest one in the window is a minute old.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._rate_limit_lock:
+            if len(self._request_times) >= self.requests_per_minute:
+                wait = self._request_times[0] + self.RATE_LIMIT_WINDOW - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._request_times.popleft()
+            self._request_times.append(loop.time())
+
+    def _parse_articles(self, docs: list[dict], light: bool = False) -> list[Article]:
+        """Parse a list of API documents, drawing all their IDs in one batch.
+
+        Docs that can't be parsed even after resetting bad fields are dropped.
+        """
+        parse = self._parse_article
+        articles = [
+            parse(doc, article_id, light)
+            for doc, article_id in zip(docs, uuid7_batch(len(docs)))
+        ]
+        return [article for article in articles if article is not None]
+
+    def _parse_article(
+        self, doc: dict, article_id: UUID | None = None, light: bool = False
+    ) -> Article | None:
+        """Parse a document from the NYT API response into an Article.
+
+        Validation runs in pydantic-core, which is several times faster than
+        building the nested models with model_construct() in Python. Fields
+        that fail validation are reset to their defaults and the doc is
+        validated again, so every returned Article can be saved and loaded back.
+
+        Args:
+            doc: A single document from the API's "docs" list
+            article_id: ID for the article (a new uuid4 if omitted)
+            light: Skip byline and keywords, which extraction doesn't use
+
+        Returns:
+            The parsed Article, or None if the doc is unusable
+        """
+        get = doc.get
+        headline_data = get("headline") or {}
+        byline_data = None if light else get("byline")
+        keywords_data = [] if light else get("keywords") or []
+        if type(keywords_data) is list:
+            # Copies, so interning the names leaves the caller's doc untouched
+            keywords_data = [
+                {**keyword, "name": intern_str(keyword["name"])}
+                if type(keyword) is dict and "name" in keyword
+                else keyword
+                for keyword in keywords_data
+            ]
+
+        pub_date = parse_iso_datetime(get("pub_date")) or datetime.now(UTC)
+
+        data = {
+            "id": article_id or uuid4(),
+            "web_url": get("web_url", ""),
+            "snippet": get("snippet"),
+            "lead_paragraph": get("lead_paragraph"),
+            "abstract": get("abstract"),
+            "source": intern_str(get("source", "The New York Times")),
+            "pub_date": pub_date,
+            "document_type": intern_str(get("document_type", "article")),
+            "section_name": intern_str(get("section_name")),
+            "subsection_name": intern_str(get("subsection_name")),
+            "word_count": get("word_count", 0),
+            "headline": {
+                "main": headline_data.get("main") or "",
+                "print_headline": headline_data.get("print_headline"),
+            },
+            "byline": None,
+            "keywords": keywords_data,
+        }
         if byline_data:
-            byline = Byline(
-                original=byline_data.get("original"),
-                organization=byline_data.get("organization"),
-            )
-
-        keywords = []
-        for kw in doc.get("keywords") or []:
-            keywords.append(
-                Keyword(
-                    name=kw.get("name", ""),
-                    value=kw.get("value", ""),
-                    rank=kw.get("rank", 0),
-                    major=kw.get("major", "N"),
-                )
-            )
-
-        # Parse publication date
-        pub_date_str = doc.get("pub_date", "")
+            data["byline"] = {
+                "original": byline_data.get("original"),
+                "organization": byline_data.get("organization"),
+            }
+
         try:
-            pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            pub_date = datetime.utcnow()
-
-        return Article(
-            id=uuid4(),
-            web_url=doc.get("web_url", ""),
-            snippet=doc.get("snippet"),
-            lead_paragraph=doc.get("lead_paragraph"),
-            abstract=doc.get("abstract"),
-            headline=headline,
-            byline=byline,
-            source=doc.get("source", "The New York Times"),
-            pub_date=pub_date,
-            document_type=doc.get("document_type", "article"),
-            section_name=doc.get("section_name"),
-            subsection_name=doc.get("subsection_name"),
-            keywords=keywords,
-            word_count=doc.get("word_count", 0),
-        )
+            return Article.model_validate(data)
+        except ValidationError as error:
+            _reset_invalid_fields(data, error)
+
+        try:
+            return Article.model_validate(data)
+        except ValidationError:
+            return None
 
     async def search(
         self,
-        query: Optional[str] = None,
-        begin_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        query: str | None = None,
+        begin_date: datetime | None = None,
+        end_date: datetime | None = None,
         page: int = 0,
         sort: str = "newest",
-        filter_query: Optional[str] = None,
-        sections: Optional[list[str]] = None,
+        filter_query: str | None = None,
+        sections: list[str] | None = None,
     ) -> ArticleSearchResponse:
         """Search for articles matching the query.
 
@@ -145,15 +240,11 @@ class NYTClient:
         if fq_parts:
             params["fq"] = " AND ".join(fq_parts)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.BASE_URL, params=params, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.get(self.BASE_URL, params=params, timeout=30.0)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-        articles = []
-        docs = data.get("response", {}).get("docs") or []
-        for doc in docs:
-            articles.append(self._parse_article(doc))
+        articles = self._parse_articles(data.get("response", {}).get("docs") or [])
 
         total_hits = data.get("response", {}).get("meta", {}).get("hits", 0)
 
@@ -166,13 +257,13 @@ class NYTClient:
 
     async def search_all(
         self,
-        query: Optional[str] = None,
-        begin_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        query: str | None = None,
+        begin_date: datetime | None = None,
+        end_date: datetime | None = None,
         max_pages: int = 10,
         sort: str = "newest",
-        filter_query: Optional[str] = None,
-        sections: Optional[list[str]] = None,
+        filter_query: str | None = None,
+        sections: list[str] | None = None,
     ) -> list[Article]:
         """Search and return all articles across multiple pages.
 
@@ -188,38 +279,39 @@ class NYTClient:
         Returns:
             List of all articles across pages
         """
-        all_articles = []
-        page = 0
-
-        while page < max_pages:
-            result = await self.search(
-                query=query,
-                begin_date=begin_date,
-                end_date=end_date,
-                page=page,
-                sort=sort,
-                filter_query=filter_query,
-                sections=sections,
-            )
+        search_kwargs = {
+            "query": query,
+            "begin_date": begin_date,
+            "end_date": end_date,
+            "sort": sort,
+            "filter_query": filter_query,
+            "sections": sections,
+        }
 
-            all_articles.extend(result.articles)
+        if max_pages <= 0:
+            return []
 
-            # Check if we've fetched all results
-            if len(result.articles) < 10:  # NYT returns max 10 per page
-                break
-            if len(all_articles) >= result.total_hits:
-                break
+        # The first page tells us how many pages there are; fetch the rest concurrently
+        first = await self.search(page=0, **search_kwargs)
+        all_articles = list(first.articles)
+        if len(first.articles) < 10:  # NYT returns max 10 per page
+            return all_articles
 
-            page += 1
+        num_pages = min(max_pages, (first.total_hits + 9) // 10)
+        results = await asyncio.gather(
+            *(self.search(page=page, **search_kwargs) for page in range(1, num_pages))
+        )
+        for result in results:
+            all_articles.extend(result.articles)
 
         return all_articles
 
     async def search_recent(
         self,
-        query: Optional[str] = None,
+        query: str | None = None,
         days: int = 30,
         max_articles: int = 100,
-        sections: Optional[list[str]] = None,
+        sections: list[str] | None = None,
     ) -> list[Article]:
         """Search for recent articles, optionally filtered by topic or section.
 
@@ -232,7 +324,7 @@ class NYTClient:
         Returns:
             List of recent articles
         """
-        end_date = datetime.utcnow()
+        end_date = datetime.now(UTC)
         begin_date = end_date - timedelta(days=days)
 
         max_pages = (max_articles + 9) // 10  # Ceiling division
@@ -249,7 +341,7 @@ class NYTClient:
         self,
         days: int = 7,
         max_articles: int = 100,
-        sections: Optional[list[str]] = None,
+        sections: list[str] | None = None,
     ) -> list[Article]:
         """Fetch recent articles without a specific query.
 
@@ -276,19 +368,15 @@ class NYTClient:
             sections=None,  # Don't filter by section - just get recent news
         )
 
-    async def fetch_archive(self, year: int, month: int) -> ArchiveResponse:
-        """Fetch all articles from a specific month using the Archive API.
-
-        The Archive API returns all articles published in a given month
-        in a single request. This is more efficient than paginating through
-        the Article Search API for bulk historical data.
-
-        Args:
-            year: The year (1851 to present)
-            month: The month (1-12)
+    async def _stream_archive(
+        self, year: int, month: int, light: bool, header: list | None = None
+    ) -> AsyncIterator[list[Article]]:
+        """Yield a month's articles in chunks as the Archive API response streams in.
 
-        Returns:
-            ArchiveResponse with all articles from that month
+        Archive months can be tens of MB, so docs are parsed as the body
+        arrives instead of holding the raw bytes and the full decoded tree at
+        once. If header (an ijson.sendable_list) is given, the top-level
+        "copyright" value is appended to it.
         """
         if month < 1 or month > 12:
             raise ValueError(f"Month must be 1-12, got {month}")
@@ -300,30 +388,85 @@ class NYTClient:
         url = self.ARCHIVE_URL.format(year=year, month=month)
         params = {"api-key": self.api_key}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=60.0)
+        docs = ijson.sendable_list()
+        docs_parser = ijson.items_coro(docs, "response.docs.item", use_float=True)
+        # "copyright" comes first in the payload; stop feeding this parser once found
+        header_parser = (
+            ijson.items_coro(header, "copyright") if header is not None else None
+        )
+
+        async with self._client.stream("GET", url, params=params) as response:
             response.raise_for_status()
-            data = response.json()
+            async for chunk in response.aiter_bytes():
+                docs_parser.send(chunk)
+                if header_parser is not None and not header:
+                    header_parser.send(chunk)
+                if docs:
+                    yield self._parse_articles(docs, light)
+                    del docs[:]
+        docs_parser.close()
+        if docs:
+            yield self._parse_articles(docs, light)
+
+    async def fetch_archive(
+        self, year: int, month: int, light: bool = False
+    ) -> ArchiveResponse:
+        """Fetch all articles from a specific month using the Archive API.
+
+        The Archive API returns all articles published in a given month
+        in a single request. This is more efficient than paginating through
+        the Article Search API for bulk historical data.
+
+        Args:
+            year: The year (1851 to present)
+            month: The month (1-12)
+            light: Skip byline and keywords on each article (saves memory when
+                the articles are only being extracted; leave off to keep full metadata)
 
-        articles = []
-        docs = data.get("response", {}).get("docs") or []
-        for doc in docs:
-            articles.append(self._parse_article(doc))
+        Returns:
+            ArchiveResponse with all articles from that month
+        """
+        articles: list[Article] = []
+        header = ijson.sendable_list()
+        async with aclosing(self._stream_archive(year, month, light, header)) as chunks:
+            async for chunk in chunks:
+                articles.extend(chunk)
 
         return ArchiveResponse(
-            copyright=data.get("copyright", ""),
+            copyright=header[0] if header else "",
             year=year,
             month=month,
             articles=articles,
             total_hits=len(articles),
         )
 
+    @staticmethod
+    def _months_between(
+        start_year: int, start_month: int, end_year: int, end_month: int
+    ) -> list[tuple[int, int]]:
+        """List (year, month) pairs from start to end, inclusive."""
+        months = []
+        current_year = start_year
+        current_month = start_month
+
+        while (current_year, current_month) <= (end_year, end_month):
+            months.append((current_year, current_month))
+
+            # Move to next month
+            current_month += 1
+            if current_month > 12:
+                current_month = 1
+                current_year += 1
+
+        return months
+
     async def fetch_archive_range(
         self,
         start_year: int,
         start_month: int,
         end_year: int,
         end_month: int,
+        light: bool = False,
     ) -> list[ArchiveResponse]:
         """Fetch archives for a range of months.
 
@@ -332,22 +475,49 @@ class NYTClient:
             start_month: Starting month (1-12)
             end_year: Ending year
             end_month: Ending month (1-12)
+            light: Skip byline and keywords on each article (see fetch_archive)
 
         Returns:
             List of ArchiveResponse objects, one per month
         """
-        results = []
-        current_year = start_year
-        current_month = start_month
+        months = self._months_between(start_year, start_month, end_year, end_month)
 
-        while (current_year, current_month) <= (end_year, end_month):
-            result = await self.fetch_archive(current_year, current_month)
-            results.append(result)
+        # Months are fetched concurrently within the per-minute request budget
+        return list(
+            await asyncio.gather(*(self.fetch_archive(y, m, light) for y, m in months))
+        )
 
-            # Move to next month
-            current_month += 1
-            if current_month > 12:
-                current_month = 1
-                current_year += 1
+    async def stream_archive_range(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        light: bool = False,
+    ) -> AsyncIterator[Article]:
+        """Yield articles for a range of months as each response streams in.
 
-        return results
+        Unlike fetch_archive_range, nothing is accumulated: months are read
+        one at a time and reading pauses while the consumer is busy, so a
+        consumer such as ExtractionPipeline.extract_stream keeps memory flat
+        over any range. Iterate under contextlib.aclosing so stopping early
+        closes the current response immediately.
+
+        Args:
+            start_year: Starting year
+            start_month: Starting month (1-12)
+            end_year: Ending year
+            end_month: Ending month (1-12)
+            light: Skip byline and keywords on each article (see fetch_archive)
+
+        Yields:
+            Articles in archive order
+        """
+        for year, month in self._months_between(
+            start_year, start_month, end_year, end_month
+        ):
+            # Closed straight away if the consumer stops, releasing the HTTP stream
+            async with aclosing(self._stream_archive(year, month, light)) as chunks:
+                async for chunk in chunks:
+                    for article in chunk:
+                        yield article
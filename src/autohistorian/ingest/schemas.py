@@ -1,7 +1,7 @@
 """Schemas for NYT API responses."""
 
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -11,14 +11,14 @@ class Headline(BaseModel):
     """Article headline from NYT API."""
 
     main: str
-    print_headline: Optional[str] = None
+    print_headline: str | None = None
 
 
 class Byline(BaseModel):
     """Article byline information."""
 
-    original: Optional[str] = None
-    organization: Optional[str] = None
+    original: str | None = None
+    organization: str | None = None
 
 
 class Multimedia(BaseModel):
@@ -26,15 +26,15 @@ class Multimedia(BaseModel):
 
     url: str
     type: str
-    subtype: Optional[str] = None
-    caption: Optional[str] = None
+    subtype: str | None = None
+    caption: str | None = None
 
 
 class Keyword(BaseModel):
     """Keyword/tag from article."""
 
-    name: str
-    value: str
+    name: str = ""
+    value: str = ""
     rank: int = 0
     major: str = "N"
 
@@ -44,27 +44,42 @@ class Article(BaseModel):
 
     id: UUID = Field(default_factory=uuid4)
     web_url: str
-    snippet: Optional[str] = None
-    lead_paragraph: Optional[str] = None
-    abstract: Optional[str] = None
+    snippet: str | None = None
+    lead_paragraph: str | None = None
+    abstract: str | None = None
     headline: Headline
-    byline: Optional[Byline] = None
+    byline: Byline | None = None
     source: str = "The New York Times"
     pub_date: datetime
     document_type: str = "article"
-    section_name: Optional[str] = None
-    subsection_name: Optional[str] = None
+    section_name: str | None = None
+    subsection_name: str | None = None
     keywords: list[Keyword] = Field(default_factory=list)
     word_count: int = 0
 
     # Full text (fetched separately if needed)
-    full_text: Optional[str] = None
+    full_text: str | None = None
 
     @property
     def title(self) -> str:
         """Get the main headline."""
         return self.headline.main
 
+    @property
+    def has_text(self) -> bool:
+        """Whether there is any body text (abstract, lead, or snippet) to extract from."""
+        return bool(self.abstract or self.lead_paragraph or self.snippet)
+
+    @cached_property
+    def extraction_text(self) -> str:
+        """Headline, abstract, and lead paragraph formatted for LLM extraction.
+
+        Built once per article and shared by all extractors.
+        """
+        abstract = f"\n\nAbstract: {self.abstract}" if self.abstract else ""
+        lead = f"\n\nLead: {self.lead_paragraph}" if self.lead_paragraph else ""
+        return f"Headline: {self.headline.main}{abstract}{lead}"
+
 
 class ArticleSearchResponse(BaseModel):
     """Response from NYT Article Search API."""
@@ -87,8 +102,8 @@ class SearchMeta(BaseModel):
     """Metadata about a search query."""
 
     query: str
-    begin_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    begin_date: datetime | None = None
+    end_date: datetime | None = None
     page: int = 0
     total_hits: int = 0
 
@@ -0,0 +1,13 @@
+"""Interning for low-cardinality string fields."""
+
+import sys
+from typing import Any
+
+
+def intern_str(value: Any) -> Any:
+    """Intern a string so repeated values share one object; other values pass through.
+
+    Used for fields like section names and event types, which take a small
+    set of values across many thousands of records.
+    """
+    return sys.intern(value) if type(value) is str else value
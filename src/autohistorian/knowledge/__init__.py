@@ -1,13 +1,13 @@
 """Knowledge store and models."""
 
-from .models import Entity, Event, ExtractionResult, ExtractedTopic, Statement, Topic
+from .models import Entity, Event, ExtractedTopic, ExtractionResult, Statement, Topic
 from .store import KnowledgeStore
 
 __all__ = [
     "Entity",
     "Event",
-    "ExtractionResult",
     "ExtractedTopic",
+    "ExtractionResult",
     "KnowledgeStore",
     "Statement",
     "Topic",
@@ -0,0 +1,104 @@
+"""SQLite database backing the topic indices."""
+
+import sqlite3
+from pathlib import Path
+
+# Binary JSONB columns need SQLite 3.45+; older builds store JSON text
+HAS_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+JSON_IN = "jsonb(?)" if HAS_JSONB else "?"
+JSON_OUT = "json(data)" if HAS_JSONB else "data"
+
+# Bumped when the schema changes; 0 means a freshly created database
+SCHEMA_VERSION = 3
+
+# Timeline sort keys: the time an item happened (falling back to when it was
+# reported) and the time it was reported. Indexed per topic, so the earliest
+# items of a timeline are read straight off the index.
+VALID_TIME_KEY = "COALESCE(NULLIF(valid_time, ''), observation_time, '')"
+OBSERVED_TIME_KEY = "COALESCE(observation_time, '')"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS topics (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL DEFAULT 'other',
+    article_count INTEGER NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    statement_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS topic_articles (
+    topic TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    PRIMARY KEY (topic, article_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    valid_time TEXT,
+    observation_time TEXT,
+    data BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS statements (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    valid_time TEXT,
+    observation_time TEXT,
+    data BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS events_topic_valid_key ON events (topic, {VALID_TIME_KEY});
+CREATE INDEX IF NOT EXISTS events_topic_observed_key ON events (topic, {OBSERVED_TIME_KEY});
+CREATE INDEX IF NOT EXISTS statements_topic_valid_key ON statements (topic, {VALID_TIME_KEY});
+CREATE INDEX IF NOT EXISTS statements_topic_observed_key ON statements (topic, {OBSERVED_TIME_KEY});
+"""
+
+# Recompute the per-topic counters from the rows they summarize
+RECOUNT_TOPICS = """
+UPDATE topics SET
+    article_count = (SELECT COUNT(*) FROM topic_articles WHERE topic = name),
+    event_count = (SELECT COUNT(*) FROM events WHERE topic = name),
+    statement_count = (SELECT COUNT(*) FROM statements WHERE topic = name)
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open the knowledge database, creating the schema if needed.
+
+    WAL mode with synchronous=NORMAL makes each commit a single append to
+    the write-ahead log instead of a full journal sync.
+
+    Args:
+        path: Path to the database file
+
+    Returns:
+        Open connection
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.executescript(SCHEMA)
+
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if 0 < version < SCHEMA_VERSION:
+        _upgrade(conn, version)
+    return conn
+
+
+def _upgrade(conn: sqlite3.Connection, version: int) -> None:
+    """Bring a database written by an older schema version up to date."""
+    with conn:
+        if version < 2:
+            # Version 1 had no per-topic counters
+            for column in ("article_count", "event_count", "statement_count"):
+                conn.execute(
+                    f"ALTER TABLE topics ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+                )
+            conn.execute(RECOUNT_TOPICS)
+        if version < 3:
+            # Superseded by the timeline key indexes
+            conn.execute("DROP INDEX IF EXISTS events_topic_valid_time")
+            conn.execute("DROP INDEX IF EXISTS statements_topic_valid_time")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
@@ -1,7 +1,6 @@
 """Knowledge graph models for events, statements, and entities."""
 
 from datetime import datetime
-from typing import Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -14,7 +13,7 @@ class Entity(BaseModel):
     name: str
     entity_type: str  # person, organization, location, etc.
     aliases: list[str] = Field(default_factory=list)
-    description: Optional[str] = None
+    description: str | None = None
 
 
 class Event(BaseModel):
@@ -25,16 +24,16 @@ class Event(BaseModel):
     event_type: str  # arrest, statement, policy_change, etc.
 
     # Dual timeline
-    valid_time: Optional[datetime] = None  # When it actually happened
-    observation_time: Optional[datetime] = None  # When it was reported
+    valid_time: datetime | None = None  # When it actually happened
+    observation_time: datetime | None = None  # When it was reported
 
     # Participants
     participants: list[str] = Field(default_factory=list)
-    location: Optional[str] = None
+    location: str | None = None
 
     # Source tracking
-    source_article_id: Optional[UUID] = None
-    source_url: Optional[str] = None
+    source_article_id: UUID | None = None
+    source_url: str | None = None
     confidence: float = 1.0
 
 
@@ -44,19 +43,19 @@ class Statement(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     content: str
     speaker: str
-    speaker_role: Optional[str] = None
+    speaker_role: str | None = None
 
     # Stance detection
-    stance: Optional[str] = None  # pro, con, neutral
-    target: Optional[str] = None  # What the statement is about
+    stance: str | None = None  # pro, con, neutral
+    target: str | None = None  # What the statement is about
 
     # Dual timeline
-    valid_time: Optional[datetime] = None  # When statement was made
-    observation_time: Optional[datetime] = None  # When it was reported
+    valid_time: datetime | None = None  # When statement was made
+    observation_time: datetime | None = None  # When it was reported
 
     # Source tracking
-    source_article_id: Optional[UUID] = None
-    source_url: Optional[str] = None
+    source_article_id: UUID | None = None
+    source_url: str | None = None
 
 
 class Topic(BaseModel):
@@ -65,7 +64,7 @@ class Topic(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     name: str
     category: str = "other"  # politics, law, international, economy, etc.
-    description: Optional[str] = None
+    description: str | None = None
     keywords: list[str] = Field(default_factory=list)
 
 
@@ -1,16 +1,166 @@
 """Knowledge store for persisting extracted data."""
 
-import json
+import mmap
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any
 from uuid import UUID
 
+import orjson
+from pydantic import TypeAdapter
+
 from ..ingest.schemas import Article
-from .models import Entity, Event, ExtractionResult, Statement, Topic
+from . import db
+from .models import Event, ExtractionResult, Statement
+
+# Parsed topics kept by get_topic_data
+TOPIC_CACHE_SIZE = 256
+
+# Files above this size are parsed from a memory map
+MMAP_MIN_SIZE = 256 * 1024
+
+# Validate whole lists in one call instead of one model_validate per item
+_EVENT_LIST_ADAPTER = TypeAdapter(list[Event])
+_STATEMENT_LIST_ADAPTER = TypeAdapter(list[Statement])
+
+# Earliest timeline items of a topic, merged from the per-table index scans;
+# ties keep events before statements, each in insertion order
+_TIMELINE_HEAD = """
+SELECT is_event, data FROM (
+    SELECT * FROM (
+        SELECT 1 AS is_event, id, {key} AS time_key, {json} AS data
+        FROM events WHERE topic = ? ORDER BY time_key, id LIMIT ?
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 0 AS is_event, id, {key} AS time_key, {json} AS data
+        FROM statements WHERE topic = ? ORDER BY time_key, id LIMIT ?
+    )
+)
+ORDER BY time_key, is_event DESC, id
+LIMIT ?
+"""
+_TIMELINE_HEAD_VALID = _TIMELINE_HEAD.format(key=db.VALID_TIME_KEY, json=db.JSON_OUT)
+_TIMELINE_HEAD_OBSERVED = _TIMELINE_HEAD.format(
+    key=db.OBSERVED_TIME_KEY, json=db.JSON_OUT
+)
+
+# Fixed SQL text so sqlite3's statement cache reuses the prepared statements
+_INSERT_TOPIC = "INSERT OR IGNORE INTO topics (name, category) VALUES (?, ?)"
+_INSERT_TOPIC_ARTICLE = (
+    "INSERT OR IGNORE INTO topic_articles (topic, article_id) VALUES (?, ?)"
+)
+_INSERT_EVENT = (
+    "INSERT INTO events (topic, valid_time, observation_time, data) "
+    f"VALUES (?, ?, ?, {db.JSON_IN})"
+)
+_INSERT_STATEMENT = (
+    "INSERT INTO statements (topic, valid_time, observation_time, data) "
+    f"VALUES (?, ?, ?, {db.JSON_IN})"
+)
+_UPDATE_TOPIC_COUNTS = (
+    "UPDATE topics SET article_count = article_count + ?, event_count = event_count + ?, "
+    "statement_count = statement_count + ? WHERE name = ?"
+)
+
+
+def _encode_rows(items: Iterable[dict]) -> list[tuple]:
+    """Encode event or statement dicts as (valid_time, observation_time, json) rows."""
+    # Bound as text: jsonb() would read a bytes parameter as binary JSONB
+    return [
+        (
+            item.get("valid_time"),
+            item.get("observation_time"),
+            orjson.dumps(item).decode(),
+        )
+        for item in items
+    ]
+
+
+def _json_files(directory: Path) -> list[str]:
+    """Paths of the .json files in a directory, from one scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
+
+
+def _count_json_files(directory: Path) -> int:
+    """Count the .json files in a sharded directory, including unsharded ones."""
+    count = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    count += len(_json_files(Path(entry.path)))
+                elif entry.name.endswith(".json"):
+                    count += 1
+    except FileNotFoundError:
+        pass
+    return count
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, mapping large files instead of copying them into memory."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_MIN_SIZE:
+            return orjson.loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return orjson.loads(view)
+
+
+def _timeline_records(data: dict) -> tuple[list[dict], int]:
+    """A topic's events followed by its statements, and the number of events."""
+    events = data.get("events", [])
+    return events + data.get("statements", []), len(events)
+
+
+def _timeline_time(record: dict, use_valid_time: bool) -> str | None:
+    """The time a record is placed at on a timeline."""
+    if use_valid_time:
+        return record.get("valid_time") or record.get("observation_time")
+    return record.get("observation_time")
+
+
+def _timeline_order(
+    records: list[dict], use_valid_time: bool
+) -> tuple[list[str | None], list[int]]:
+    """Timeline times for each record and the record indices in time order.
+
+    Only the time column is sorted, by index with a C-level key, so no
+    per-item dicts are built until the caller materializes the order.
+    """
+    times = [_timeline_time(r, use_valid_time) for r in records]
+    keys = [time or "" for time in times]
+    return times, sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def _timeline_item(record: dict, time: str | None, is_event: bool) -> dict:
+    """Build the timeline entry for an event or statement record."""
+    if is_event:
+        return {
+            "time": time,
+            "type": "event",
+            "description": record.get("description", ""),
+            "location": record.get("location"),
+        }
+    return {
+        "time": time,
+        "type": "statement",
+        "content": record.get("content", ""),
+        "speaker": record.get("speaker", "Unknown"),
+        "stance": record.get("stance"),
+    }
 
 
 class KnowledgeStore:
-    """Simple file-based knowledge store."""
+    """Knowledge store with article files and a SQLite topic index."""
 
     def __init__(self, data_dir: str = "data"):
         """Initialize the knowledge store.
@@ -21,181 +171,322 @@ class KnowledgeStore:
         self.data_dir = Path(data_dir)
         self.articles_dir = self.data_dir / "articles"
         self.extractions_dir = self.data_dir / "extractions"
+        # Legacy per-topic JSON files, imported into the database once
         self.topics_dir = self.data_dir / "topics"
 
         # Create directories
         self.articles_dir.mkdir(parents=True, exist_ok=True)
         self.extractions_dir.mkdir(parents=True, exist_ok=True)
-        self.topics_dir.mkdir(parents=True, exist_ok=True)
+
+        self.conn = db.connect(self.data_dir / "knowledge.db")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self._import_topic_files()
+            self.conn.execute(f"PRAGMA user_version = {db.SCHEMA_VERSION}")
+
+        # Parsed topic data, valid while _topic_cache_version is unchanged
+        self._topic_cache: dict[str, dict] = {}
+        self._topic_cache_version: tuple[int, int] | None = None
+        self._local_writes = 0
+
+        # Shard directories known to exist
+        self._shard_dirs: set[Path] = set()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def _shard_path(self, directory: Path, item_id: UUID) -> Path:
+        """Path of an article or extraction file inside its shard directory.
+
+        Files are spread over up to 256 subdirectories by the last two hex
+        digits of the ID, which are random for both UUIDv4 and UUIDv7 (the
+        leading digits of a UUIDv7 are its timestamp).
+        """
+        name = str(item_id)
+        return directory / name[-2:] / f"{name}.json"
+
+    def _write_sharded(self, directory: Path, item_id: UUID, content: bytes) -> None:
+        """Write a file to its shard, creating the shard directory on first use."""
+        path = self._shard_path(directory, item_id)
+        if path.parent not in self._shard_dirs:
+            path.parent.mkdir(exist_ok=True)
+            self._shard_dirs.add(path.parent)
+        path.write_bytes(content)
 
     def save_article(self, article: Article) -> None:
         """Save an article to the store."""
-        path = self.articles_dir / f"{article.id}.json"
-        path.write_text(article.model_dump_json(indent=2))
+        self._write_sharded(
+            self.articles_dir, article.id, article.model_dump_json(indent=2).encode()
+        )
 
-    def get_article(self, article_id: UUID) -> Optional[Article]:
+    def get_article(self, article_id: UUID) -> Article | None:
         """Retrieve an article by ID."""
-        path = self.articles_dir / f"{article_id}.json"
+        path = self._shard_path(self.articles_dir, article_id)
         if not path.exists():
-            return None
-        return Article.model_validate_json(path.read_text())
+            # Stores written before sharding keep articles at the top level
+            path = self.articles_dir / f"{article_id}.json"
+            if not path.exists():
+                return None
+        return Article.model_validate_json(path.read_bytes())
 
     def save_extraction_result(
-        self, result: ExtractionResult, topic: Optional[str] = None
+        self, result: ExtractionResult, topic: str | None = None
     ) -> None:
         """Save extraction results."""
-        # Save to extractions directory
-        path = self.extractions_dir / f"{result.article_id}.json"
-        path.write_text(result.model_dump_json(indent=2))
+        # Dump the result once; the file and the topic rows share the dicts
+        result_data = result.model_dump(mode="json")
 
-        # Update topic indices
-        for extracted_topic in result.topics:
-            self._add_to_topic(extracted_topic.name, extracted_topic.category, result)
+        # Save to extractions directory
+        self._write_sharded(
+            self.extractions_dir,
+            result.article_id,
+            orjson.dumps(result_data, option=orjson.OPT_INDENT_2),
+        )
 
-    def _add_to_topic(
-        self, topic_name: str, category: str, result: ExtractionResult
+        if not result.topics:
+            return
+
+        # Update every topic in a single transaction
+        article_ids = [result_data["article_id"]]
+        events = _encode_rows(result_data["events"])
+        statements = _encode_rows(result_data["statements"])
+        self._local_writes += 1
+        with self.conn:
+            for extracted_topic in result.topics:
+                self._insert_topic_rows(
+                    extracted_topic.name,
+                    extracted_topic.category,
+                    article_ids,
+                    events,
+                    statements,
+                )
+
+    def _insert_topic_rows(
+        self,
+        topic_name: str,
+        category: str,
+        article_ids: list[str],
+        events: list[tuple],
+        statements: list[tuple],
     ) -> None:
-        """Add extraction results to a topic index."""
-        safe_name = topic_name.replace("/", "_").replace(" ", "_")[:100]
-        topic_file = self.topics_dir / f"{safe_name}.json"
-
-        if topic_file.exists():
-            topic_data = json.loads(topic_file.read_text())
-        else:
-            topic_data = {
-                "name": topic_name,
-                "category": category,
-                "article_ids": [],
-                "events": [],
-                "statements": [],
-            }
-
-        # Add article reference
-        article_id_str = str(result.article_id)
-        if article_id_str not in topic_data["article_ids"]:
-            topic_data["article_ids"].append(article_id_str)
-
-        # Add events
-        for event in result.events:
-            event_data = event.model_dump(mode="json")
-            topic_data["events"].append(event_data)
+        """Insert a topic's rows; the caller owns the transaction.
 
-        # Add statements
-        for statement in result.statements:
-            statement_data = statement.model_dump(mode="json")
-            topic_data["statements"].append(statement_data)
+        Events and statements are (valid_time, observation_time, json) rows
+        from _encode_rows, shared by every topic they are added to.
+        """
+        conn = self.conn
+        conn.execute(_INSERT_TOPIC, (topic_name, category))
+        # rowcount only includes article links that weren't already present
+        new_articles = conn.executemany(
+            _INSERT_TOPIC_ARTICLE,
+            [(topic_name, article_id) for article_id in article_ids],
+        ).rowcount
+        for sql, rows in ((_INSERT_EVENT, events), (_INSERT_STATEMENT, statements)):
+            conn.executemany(sql, [(topic_name, *row) for row in rows])
+
+        # Keep the counters in step so stats never count rows
+        conn.execute(
+            _UPDATE_TOPIC_COUNTS,
+            (new_articles, len(events), len(statements), topic_name),
+        )
 
-        topic_file.write_text(json.dumps(topic_data, indent=2, default=str))
+    def _import_topic_files(self) -> None:
+        """Import topic JSON files written by the file-based store."""
+        paths = sorted(_json_files(self.topics_dir))
+        if not paths:
+            return
+
+        # Load files in parallel; inserts stay on this thread
+        with ThreadPoolExecutor(max_workers=16) as pool, self.conn:
+            for data in pool.map(_load_json_file, paths):
+                self._insert_topic_rows(
+                    data["name"],
+                    data.get("category", "other"),
+                    data.get("article_ids", []),
+                    _encode_rows(data.get("events", [])),
+                    _encode_rows(data.get("statements", [])),
+                )
 
     def get_topics(self) -> list[str]:
         """Get all topic names."""
-        topics = []
-        for path in self.topics_dir.glob("*.json"):
-            data = json.loads(path.read_text())
-            topics.append(data["name"])
-        return sorted(topics)
+        rows = self.conn.execute("SELECT name FROM topics ORDER BY name")
+        return [name for (name,) in rows]
 
     def get_all_topics_info(self) -> list[dict]:
         """Get info about all topics, sorted by coverage."""
-        topics_info = []
-        for path in self.topics_dir.glob("*.json"):
-            data = json.loads(path.read_text())
-            topics_info.append({
-                "name": data["name"],
-                "category": data.get("category", "other"),
-                "article_count": len(data.get("article_ids", [])),
-                "event_count": len(data.get("events", [])),
-                "statement_count": len(data.get("statements", [])),
-            })
-
-        # Sort by total coverage (articles + events + statements)
-        topics_info.sort(
-            key=lambda t: t["article_count"] + t["event_count"] + t["statement_count"],
-            reverse=True,
+        rows = self.conn.execute(
+            """
+            SELECT name, category, article_count, event_count, statement_count
+            FROM topics
+            ORDER BY article_count + event_count + statement_count DESC
+            """
         )
-        return topics_info
+        # Sorted by total coverage (articles + events + statements)
+        return [
+            {
+                "name": name,
+                "category": category,
+                "article_count": article_count,
+                "event_count": event_count,
+                "statement_count": statement_count,
+            }
+            for name, category, article_count, event_count, statement_count in rows
+        ]
+
+    def get_topic_data(self, topic_name: str) -> dict | None:
+        """Get all data for a topic.
 
-    def get_topic_data(self, topic_name: str) -> Optional[dict]:
-        """Get all data for a topic."""
-        safe_name = topic_name.replace("/", "_").replace(" ", "_")[:100]
-        topic_file = self.topics_dir / f"{safe_name}.json"
-        if not topic_file.exists():
+        Parsed topics are cached until the database changes, so the returned
+        dict is shared between callers and must not be modified.
+        """
+        # data_version moves on commits from other connections, _local_writes on ours
+        version = (
+            self.conn.execute("PRAGMA data_version").fetchone()[0],
+            self._local_writes,
+        )
+        if version != self._topic_cache_version:
+            self._topic_cache.clear()
+            self._topic_cache_version = version
+
+        data = self._topic_cache.get(topic_name)
+        if data is None:
+            data = self._load_topic_data(topic_name)
+            if data is None:
+                return None
+            if len(self._topic_cache) >= TOPIC_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._topic_cache[next(iter(self._topic_cache))]
+            self._topic_cache[topic_name] = data
+        return data
+
+    def _load_topic_data(self, topic_name: str) -> dict | None:
+        """Read a topic and all of its events and statements from the database."""
+        conn = self.conn
+        row = conn.execute(
+            "SELECT category FROM topics WHERE name = ?", (topic_name,)
+        ).fetchone()
+        if row is None:
             return None
-        return json.loads(topic_file.read_text())
+
+        article_ids = conn.execute(
+            "SELECT article_id FROM topic_articles WHERE topic = ?", (topic_name,)
+        )
+        events = conn.execute(
+            f"SELECT {db.JSON_OUT} FROM events WHERE topic = ? ORDER BY id",
+            (topic_name,),
+        )
+        statements = conn.execute(
+            f"SELECT {db.JSON_OUT} FROM statements WHERE topic = ? ORDER BY id",
+            (topic_name,),
+        )
+        return {
+            "name": topic_name,
+            "category": row[0],
+            "article_ids": [article_id for (article_id,) in article_ids],
+            "events": [orjson.loads(data) for (data,) in events],
+            "statements": [orjson.loads(data) for (data,) in statements],
+        }
 
     def get_events_for_topic(self, topic_name: str) -> list[Event]:
         """Get all events for a topic."""
         data = self.get_topic_data(topic_name)
         if not data:
             return []
-        return [Event.model_validate(e) for e in data.get("events", [])]
+        return _EVENT_LIST_ADAPTER.validate_python(data.get("events", []))
 
     def get_statements_for_topic(self, topic_name: str) -> list[Statement]:
         """Get all statements for a topic."""
         data = self.get_topic_data(topic_name)
         if not data:
             return []
-        return [Statement.model_validate(s) for s in data.get("statements", [])]
+        return _STATEMENT_LIST_ADAPTER.validate_python(data.get("statements", []))
 
     def get_timeline(
-        self, topic_name: str, use_valid_time: bool = True
+        self, topic_name: str, use_valid_time: bool = True, limit: int | None = None
     ) -> list[dict]:
         """Get timeline items for a topic.
 
         Args:
             topic_name: Name of the topic
             use_valid_time: If True, sort by when events happened. If False, sort by when reported.
+            limit: If given, return only the earliest limit items, read in
+                order from the timeline index instead of loading the topic
 
         Returns:
             List of timeline items with time, type, and description
         """
+        if limit is not None:
+            return self._timeline_head(topic_name, use_valid_time, limit)
+
         data = self.get_topic_data(topic_name)
         if not data:
             return []
 
-        items = []
+        records, event_count = _timeline_records(data)
+        times, order = _timeline_order(records, use_valid_time)
+        return [_timeline_item(records[i], times[i], i < event_count) for i in order]
 
-        for event in data.get("events", []):
-            time_key = "valid_time" if use_valid_time else "observation_time"
-            items.append({
-                "time": event.get(time_key) or event.get("observation_time"),
-                "type": "event",
-                "description": event.get("description", ""),
-                "location": event.get("location"),
-            })
-
-        for statement in data.get("statements", []):
-            time_key = "valid_time" if use_valid_time else "observation_time"
-            items.append({
-                "time": statement.get(time_key) or statement.get("observation_time"),
-                "type": "statement",
-                "content": statement.get("content", ""),
-                "speaker": statement.get("speaker", "Unknown"),
-                "stance": statement.get("stance"),
-            })
-
-        # Sort by time
-        items.sort(key=lambda x: x.get("time") or "")
+    def get_timeline_both(
+        self, topic_name: str, limit: int | None = None
+    ) -> tuple[list[dict], list[dict]]:
+        """Get a topic's timeline ordered both ways.
+
+        Args:
+            topic_name: Name of the topic
+            limit: If given, return only the earliest limit items of each
+
+        Returns:
+            (items sorted by when they happened, items sorted by when reported)
+        """
+        if limit is not None:
+            return (
+                self._timeline_head(topic_name, True, limit),
+                self._timeline_head(topic_name, False, limit),
+            )
+
+        data = self.get_topic_data(topic_name)
+        if not data:
+            return [], []
+
+        # Both orderings come from a single read of the topic
+        records, event_count = _timeline_records(data)
+        timelines = []
+        for use_valid_time in (True, False):
+            times, order = _timeline_order(records, use_valid_time)
+            timelines.append(
+                [_timeline_item(records[i], times[i], i < event_count) for i in order]
+            )
+        return timelines[0], timelines[1]
+
+    def _timeline_head(
+        self, topic_name: str, use_valid_time: bool, limit: int
+    ) -> list[dict]:
+        """The earliest limit timeline items, parsing only the rows returned."""
+        sql = _TIMELINE_HEAD_VALID if use_valid_time else _TIMELINE_HEAD_OBSERVED
+        rows = self.conn.execute(sql, (topic_name, limit, topic_name, limit, limit))
+        items = []
+        for is_event, data in rows:
+            record = orjson.loads(data)
+            items.append(
+                _timeline_item(
+                    record, _timeline_time(record, use_valid_time), bool(is_event)
+                )
+            )
         return items
 
     def get_stats(self) -> dict:
         """Get statistics about the knowledge store."""
-        article_count = len(list(self.articles_dir.glob("*.json")))
-        extraction_count = len(list(self.extractions_dir.glob("*.json")))
-        topic_count = len(list(self.topics_dir.glob("*.json")))
-
-        # Count events and statements across all topics
-        total_events = 0
-        total_statements = 0
-        for path in self.topics_dir.glob("*.json"):
-            data = json.loads(path.read_text())
-            total_events += len(data.get("events", []))
-            total_statements += len(data.get("statements", []))
+        article_count = _count_json_files(self.articles_dir)
+        extraction_count = _count_json_files(self.extractions_dir)
+
+        topic_count, total_events, total_statements = self.conn.execute(
+            "SELECT COUNT(*), TOTAL(event_count), TOTAL(statement_count) FROM topics"
+        ).fetchone()
 
         return {
             "articles": article_count,
             "extractions": extraction_count,
             "topics": topic_count,
-            "events": total_events,
-            "statements": total_statements,
+            "events": int(total_events),
+            "statements": int(total_statements),
         }
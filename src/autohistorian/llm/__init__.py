@@ -1,5 +1,6 @@
 """LLM client and prompts for extraction and synthesis."""
 
+from .cache import ResponseCache
 from .client import GeminiClient
 
-__all__ = ["GeminiClient"]
+__all__ = ["GeminiClient", "ResponseCache"]
@@ -0,0 +1,112 @@
+"""Caches for LLM responses."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+
+class ResponseCache:
+    """Exact-match cache of parsed LLM results, stored as one JSON file per key."""
+
+    def __init__(self, cache_dir: str | Path, ttl: float = 7 * 86400):
+        """Initialize the response cache.
+
+        Args:
+            cache_dir: Directory to store cache entries
+            ttl: Seconds before an entry expires (default: 7 days)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the model, task name, and input text."""
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def has(self, key: str) -> bool:
+        """Check whether a key has an unexpired entry, without reading it."""
+        try:
+            return time.time() - self._path(key).stat().st_mtime <= self.ttl
+        except OSError:
+            return False
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value under a key."""
+        self._path(key).write_text(json.dumps(value, default=str))
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value unless it is empty.
+
+        Empty results (including dicts whose values are all empty) usually
+        mean the response could not be parsed, so they are not cached.
+        """
+        if not _is_empty(value):
+            self.set(key, value)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value, or await fetch() and cache it via put()."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = await fetch()
+        self.put(key, value)
+        return value
+
+
+class LRUCache:
+    """In-memory LRU cache whose entries also expire after a TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Entries kept before the least recently used is evicted
+            ttl: Seconds before an entry expires
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() > expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a parsed result carries no data."""
+    if isinstance(value, dict):
+        return not any(value.values())
+    return not value
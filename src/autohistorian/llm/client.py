@@ -1,53 +1,101 @@
 """Gemini LLM client for extraction and synthesis tasks."""
 
 import asyncio
-import json
+import hashlib
+import math
 import re
 import time
 from typing import Any
 
+import orjson
 from google import genai
 from google.genai import types
 
+from .cache import LRUCache
 from .prompts import (
-    ARTICLE_SYNTHESIS_PROMPT,
-    ENTITY_EXTRACTION_PROMPT,
-    EVENT_EXTRACTION_PROMPT,
-    OUTLINE_GENERATION_PROMPT,
-    STANCE_DETECTION_PROMPT,
-    STATEMENT_EXTRACTION_PROMPT,
+    ARTICLE_SYNTHESIS_PARTS,
+    BATCH_EXTRACTION_PARTS,
+    COMBINED_EXTRACTION_PARTS,
+    ENTITY_EXTRACTION_PARTS,
+    EVENT_EXTRACTION_PARTS,
+    OUTLINE_GENERATION_PARTS,
+    STANCE_DETECTION_PARTS,
+    STATEMENT_EXTRACTION_PARTS,
     SYSTEM_PROMPT,
+    fill,
 )
+from .schemas import (
+    BATCH_EXTRACTION_SCHEMA,
+    COMBINED_EXTRACTION_SCHEMA,
+    ENTITY_LIST_SCHEMA,
+    EVENT_LIST_SCHEMA,
+    STANCE_SCHEMA,
+    STATEMENT_LIST_SCHEMA,
+)
+
+# Keys of the JSON object returned by combined extraction
+EXTRACTION_KEYS = ("events", "statements", "entities", "topics")
+
+# Patterns used by GeminiClient._extract_json
+_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+
+def _dumps_indented(value: Any) -> str:
+    """Serialize prompt data as indented JSON text."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str).decode()
 
 
 class RateLimiter:
     """Token bucket rate limiter for API calls."""
 
-    def __init__(self, requests_per_minute: int = 10):  # Conservative for Gemini free tier
+    # Defaults are conservative for the Gemini free tier
+    def __init__(self, requests_per_minute: int = 10, burst: int = 5):
         self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self._last_request_time = 0.0
+        self.rate = requests_per_minute / 60.0  # Tokens per second
+        self.capacity = float(max(1, min(burst, requests_per_minute)))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def acquire(self):
-        """Wait until we can make a request."""
-        async with self._lock:
-            now = time.monotonic()
-            time_since_last = now - self._last_request_time
-            if time_since_last < self.min_interval:
-                await asyncio.sleep(self.min_interval - time_since_last)
-            self._last_request_time = time.monotonic()
+        """Wait until we can make a request.
+
+        The lock only guards the token arithmetic; waiting callers sleep
+        outside it so a burst of calls can proceed in parallel.
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
 
 
 class GeminiClient:
     """Client for Gemini API interactions with rate limiting and retries."""
 
+    # Gemini rejects explicit caches below a minimum prompt size
+    MIN_CACHE_TOKENS = 4096
+    # Explicit caches are recreated this many seconds before Gemini expires
+    # them, so requests already in flight never reference an expired cache
+    PROMPT_CACHE_MARGIN = 30.0
+
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-2.0-flash",
         requests_per_minute: int = 20,
         max_retries: int = 3,
+        response_cache_size: int = 256,
+        response_cache_ttl: float = 3600.0,
     ):
         """Initialize the Gemini client.
 
@@ -56,56 +104,164 @@ class GeminiClient:
             model: Model to use (default: gemini-2.0-flash)
             requests_per_minute: Rate limit (default: 20, under Gemini's 25/min)
             max_retries: Max retries on rate limit errors
+            response_cache_size: Raw responses kept in memory, keyed by prompt
+            response_cache_ttl: Seconds a cached response stays valid
         """
         self.client = genai.Client(api_key=api_key)
         self.model = model
         self.rate_limiter = RateLimiter(requests_per_minute)
         self.max_retries = max_retries
+        self._responses = LRUCache(response_cache_size, response_cache_ttl)
+        # system prompt -> (cache name, monotonic refresh deadline, ttl seconds)
+        self._prompt_caches: dict[str, tuple[str | None, float, float]] = {}
+        self._prompt_cache_lock = asyncio.Lock()
+
+    async def ensure_prompt_cache(
+        self, system_prompt: str = SYSTEM_PROMPT, ttl: float = 600.0
+    ) -> str | None:
+        """Create an explicit context cache for a system prompt.
+
+        The cache is reused until shortly before its TTL runs out and then
+        recreated, so a long-lived client keeps working past the first TTL.
+        Prompts below MIN_CACHE_TOKENS (estimated at ~4 chars per token) are
+        not eligible for explicit caching and fall back to sending the system
+        instruction with every request.
+
+        Args:
+            system_prompt: The system instruction to cache
+            ttl: Seconds Gemini should keep the cache
+
+        Returns:
+            The cache name, or None if the prompt is not cached
+        """
+        entry = self._prompt_caches.get(system_prompt)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+
+        async with self._prompt_cache_lock:
+            # Another caller may have refreshed it while we waited
+            entry = self._prompt_caches.get(system_prompt)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+
+            cache_name = None
+            refresh_at = math.inf
+            if len(system_prompt) // 4 >= self.MIN_CACHE_TOKENS:
+                started = time.monotonic()
+                try:
+                    cache = await self.client.aio.caches.create(
+                        model=self.model,
+                        config=types.CreateCachedContentConfig(
+                            system_instruction=system_prompt,
+                            ttl=f"{ttl:.0f}s",
+                        ),
+                    )
+                    cache_name = cache.name
+                    refresh_at = started + ttl - self.PROMPT_CACHE_MARGIN
+                except Exception:  # noqa: BLE001
+                    # Caching is an optimization; fall back to uncached requests
+                    cache_name = None
+
+            self._prompt_caches[system_prompt] = (cache_name, refresh_at, ttl)
+            return cache_name
 
     def _extract_json(self, text: str) -> Any:
         """Extract JSON from LLM response, handling markdown code blocks."""
         if text is None:
             return None
         # Try to find JSON in code blocks first
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-        if json_match:
-            text = json_match.group(1).strip()
+        if "```" in text:
+            json_match = _CODEBLOCK_RE.search(text)
+            if json_match:
+                text = json_match.group(1).strip()
 
         # Try to parse as JSON
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             # Try to find array or object
-            array_match = re.search(r"\[[\s\S]*\]", text)
+            array_match = _ARRAY_RE.search(text)
             if array_match:
                 try:
-                    return json.loads(array_match.group())
-                except json.JSONDecodeError:
+                    return orjson.loads(array_match.group())
+                except orjson.JSONDecodeError:
                     pass
 
-            obj_match = re.search(r"\{[\s\S]*\}", text)
+            obj_match = _OBJECT_RE.search(text)
             if obj_match:
                 try:
-                    return json.loads(obj_match.group())
-                except json.JSONDecodeError:
+                    return orjson.loads(obj_match.group())
+                except orjson.JSONDecodeError:
                     pass
 
             return None
 
-    async def _generate(self, prompt: str, system_prompt: str = SYSTEM_PROMPT) -> str:
-        """Generate a response from the LLM with rate limiting and retries."""
+    async def _generate(
+        self,
+        prompt: str,
+        system_prompt: str = SYSTEM_PROMPT,
+        response_schema: dict | None = None,
+        cache: bool = True,
+    ) -> str:
+        """Generate a response from the LLM with rate limiting and retries.
+
+        Identical requests within the response cache TTL are answered from
+        memory; at temperature 0.2 a repeat would return nearly the same text.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: System instruction (sent via its context cache if one exists)
+            response_schema: If given, request JSON output matching this schema
+            cache: If False, always call the API (the fresh response is still cached)
+        """
+        key = hashlib.blake2b(
+            "\x00".join(
+                (
+                    self.model,
+                    system_prompt,
+                    "json" if response_schema else "text",
+                    prompt,
+                )
+            ).encode()
+        ).digest()
+        if cache:
+            cached = self._responses.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self._generate_uncached(prompt, system_prompt, response_schema)
+        if response is not None:
+            self._responses.set(key, response)
+        return response
+
+    async def _generate_uncached(
+        self, prompt: str, system_prompt: str, response_schema: dict | None
+    ) -> str:
+        """Call the API for one request, with rate limiting and retries."""
         await self.rate_limiter.acquire()
 
+        config_kwargs: dict[str, Any] = {"temperature": 0.2}
+        cache_name = None
+        entry = self._prompt_caches.get(system_prompt)
+        if entry is not None:
+            # Recreates the cache if its TTL has run out since it was made
+            cache_name = await self.ensure_prompt_cache(system_prompt, entry[2])
+        if cache_name:
+            config_kwargs["cached_content"] = cache_name
+        else:
+            config_kwargs["system_instruction"] = system_prompt
+        if response_schema is not None:
+            config_kwargs["response_mime_type"] = "application/json"
+            config_kwargs["response_schema"] = response_schema
+        config = types.GenerateContentConfig(**config_kwargs)
+
         for attempt in range(self.max_retries):
             try:
-                response = await asyncio.to_thread(
-                    self.client.models.generate_content,
+                # Native async call: no worker thread is held for the request
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        system_instruction=system_prompt,
-                        temperature=0.2,
-                    ),
+                    config=config,
                 )
                 return response.text
             except Exception as e:
@@ -128,6 +284,28 @@ class GeminiClient:
 
         return None
 
+    async def _generate_json(
+        self,
+        prompt: str,
+        response_schema: dict,
+        system_prompt: str = SYSTEM_PROMPT,
+        cache: bool = True,
+    ) -> Any:
+        """Generate structured output and parse it.
+
+        Responses in JSON mode are parsed directly; _extract_json is only the
+        fallback for replies that still arrive wrapped or malformed.
+        """
+        response = await self._generate(
+            prompt, system_prompt, response_schema=response_schema, cache=cache
+        )
+        if response is None:
+            return None
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            return self._extract_json(response)
+
     async def extract_events(self, article_text: str) -> list[dict]:
         """Extract events from article text.
 
@@ -137,9 +315,9 @@ class GeminiClient:
         Returns:
             List of event dictionaries
         """
-        prompt = EVENT_EXTRACTION_PROMPT.format(article_text=article_text)
-        response = await self._generate(prompt)
-        result = self._extract_json(response)
+        before, after = EVENT_EXTRACTION_PARTS
+        prompt = before + article_text + after
+        result = await self._generate_json(prompt, EVENT_LIST_SCHEMA)
         return result if isinstance(result, list) else []
 
     async def extract_statements(self, article_text: str) -> list[dict]:
@@ -151,9 +329,9 @@ class GeminiClient:
         Returns:
             List of statement dictionaries
         """
-        prompt = STATEMENT_EXTRACTION_PROMPT.format(article_text=article_text)
-        response = await self._generate(prompt)
-        result = self._extract_json(response)
+        before, after = STATEMENT_EXTRACTION_PARTS
+        prompt = before + article_text + after
+        result = await self._generate_json(prompt, STATEMENT_LIST_SCHEMA)
         return result if isinstance(result, list) else []
 
     async def extract_entities(self, article_text: str) -> list[dict]:
@@ -165,14 +343,73 @@ class GeminiClient:
         Returns:
             List of entity dictionaries
         """
-        prompt = ENTITY_EXTRACTION_PROMPT.format(article_text=article_text)
-        response = await self._generate(prompt)
-        result = self._extract_json(response)
+        before, after = ENTITY_EXTRACTION_PARTS
+        prompt = before + article_text + after
+        result = await self._generate_json(prompt, ENTITY_LIST_SCHEMA)
         return result if isinstance(result, list) else []
 
-    async def detect_stance(
-        self, statement: str, speaker: str, context: str
-    ) -> dict:
+    async def extract_all(self, article_text: str) -> dict[str, list[dict]]:
+        """Extract events, statements, entities, and topics in a single call.
+
+        Args:
+            article_text: The article text to analyze
+
+        Returns:
+            Dictionary with "events", "statements", "entities", and "topics" lists
+        """
+        before, after = COMBINED_EXTRACTION_PARTS
+        prompt = before + article_text + after
+        return self._split_combined(
+            await self._generate_json(prompt, COMBINED_EXTRACTION_SCHEMA)
+        )
+
+    async def batch_extract_all(
+        self, article_texts: list[str]
+    ) -> list[dict[str, list[dict]] | None]:
+        """Run combined extraction for several articles in a single call.
+
+        Articles are numbered in the prompt and the response is aligned by
+        each object's "index", so a reordered or partial reply still maps
+        back to the right article.
+
+        Args:
+            article_texts: The article texts to analyze
+
+        Returns:
+            One combined result per input, in order; None where the response
+            had no entry for that article
+        """
+        if len(article_texts) == 1:
+            return [await self.extract_all(article_texts[0])]
+
+        articles = "\n\n".join(
+            f"### Article {i}\n{text}" for i, text in enumerate(article_texts)
+        )
+        prompt = fill(BATCH_EXTRACTION_PARTS, str(len(article_texts)), articles)
+        result = await self._generate_json(prompt, BATCH_EXTRACTION_SCHEMA)
+
+        by_index: dict[int, dict] = {}
+        if isinstance(result, list):
+            for item in result:
+                if isinstance(item, dict) and isinstance(item.get("index"), int):
+                    by_index[item["index"]] = item
+
+        return [
+            self._split_combined(by_index[i]) if i in by_index else None
+            for i in range(len(article_texts))
+        ]
+
+    @staticmethod
+    def _split_combined(result: Any) -> dict[str, list[dict]]:
+        """Normalize a combined extraction response to one list per task."""
+        if not isinstance(result, dict):
+            result = {}
+        return {
+            key: value if isinstance(value := result.get(key), list) else []
+            for key in EXTRACTION_KEYS
+        }
+
+    async def detect_stance(self, statement: str, speaker: str, context: str) -> dict:
         """Detect stance in a statement.
 
         Args:
@@ -183,15 +420,12 @@ class GeminiClient:
         Returns:
             Stance detection result
         """
-        prompt = STANCE_DETECTION_PROMPT.format(
-            statement=statement, speaker=speaker, context=context
-        )
-        response = await self._generate(prompt)
-        result = self._extract_json(response)
+        prompt = fill(STANCE_DETECTION_PARTS, statement, speaker, context)
+        result = await self._generate_json(prompt, STANCE_SCHEMA)
         return result if isinstance(result, dict) else {"stance": "neutral"}
 
     async def generate_outline(
-        self, topic: str, events: list[dict], statements: list[dict]
+        self, topic: str, events: list[dict], statements: list[dict], cache: bool = True
     ) -> dict:
         """Generate an article outline.
 
@@ -199,22 +433,21 @@ class GeminiClient:
             topic: The topic to write about
             events: List of relevant events
             statements: List of relevant statements
+            cache: If False, don't reuse a cached response
 
         Returns:
             Article outline
         """
-        events_text = json.dumps(events, indent=2, default=str)
-        statements_text = json.dumps(statements, indent=2, default=str)
+        events_text = _dumps_indented(events)
+        statements_text = _dumps_indented(statements)
 
-        prompt = OUTLINE_GENERATION_PROMPT.format(
-            topic=topic, events=events_text, statements=statements_text
-        )
-        response = await self._generate(prompt)
+        prompt = fill(OUTLINE_GENERATION_PARTS, topic, events_text, statements_text)
+        response = await self._generate(prompt, cache=cache)
         result = self._extract_json(response)
         return result if isinstance(result, dict) else {}
 
     async def synthesize_article(
-        self, topic: str, events: list[dict], statements: list[dict]
+        self, topic: str, events: list[dict], statements: list[dict], cache: bool = True
     ) -> str:
         """Synthesize an article section.
 
@@ -222,14 +455,13 @@ class GeminiClient:
             topic: The topic to write about
             events: List of relevant events
             statements: List of relevant statements
+            cache: If False, don't reuse a cached response
 
         Returns:
             Article text in markdown
         """
-        events_text = json.dumps(events, indent=2, default=str)
-        statements_text = json.dumps(statements, indent=2, default=str)
+        events_text = _dumps_indented(events)
+        statements_text = _dumps_indented(statements)
 
-        prompt = ARTICLE_SYNTHESIS_PROMPT.format(
-            topic=topic, events=events_text, statements=statements_text
-        )
-        return await self._generate(prompt)
+        prompt = fill(ARTICLE_SYNTHESIS_PARTS, topic, events_text, statements_text)
+        return await self._generate(prompt, cache=cache)
@@ -1,4 +1,50 @@
-"""Prompts for LLM extraction and synthesis tasks."""
+"""Prompts for LLM extraction and synthesis tasks.
+
+Extraction prompts keep their instructions first and the article text last,
+after an ``--- ARTICLE ---`` delimiter, so every call shares the same prefix
+and the provider can reuse it from its prompt cache.
+
+The ``*_PARTS`` tuples are the same templates split once at import around
+their fields, so hot paths join strings instead of re-parsing templates
+with ``str.format`` on every call.
+"""
+
+from string import Formatter
+
+
+def split_template(template: str, *fields: str) -> tuple[str, ...]:
+    """Split a str.format template into the literal text around its fields.
+
+    The literals are unescaped ("{{" becomes "{"), so joining them with the
+    field values in order gives the same string as template.format().
+
+    Args:
+        template: The format template
+        fields: Expected field names, in the order they appear
+
+    Returns:
+        len(fields) + 1 literal parts
+    """
+    parts = [""]
+    found = []
+    for literal, field, _, _ in Formatter().parse(template):
+        parts[-1] += literal
+        if field is not None:
+            found.append(field)
+            parts.append("")
+    if tuple(found) != fields:
+        raise ValueError(f"Template fields {found} do not match {list(fields)}")
+    return tuple(parts)
+
+
+def fill(parts: tuple[str, ...], *values: str) -> str:
+    """Join pre-split template parts with their field values."""
+    pieces = [parts[0]]
+    for value, literal in zip(values, parts[1:]):
+        pieces.append(value)
+        pieces.append(literal)
+    return "".join(pieces)
+
 
 SYSTEM_PROMPT = """You are an expert at analyzing news articles and extracting structured information.
 You identify events, statements, entities, and topics with precision and accuracy.
@@ -13,11 +59,11 @@ For each event, identify:
 - participants: List of people/organizations involved
 - location: Where it happened (if mentioned)
 
-Article:
-{article_text}
-
 Respond with a JSON array of events:
-[{{"description": "...", "event_type": "...", "valid_time": "...", "participants": [...], "location": "..."}}]"""
+[{{"description": "...", "event_type": "...", "valid_time": "...", "participants": [...], "location": "..."}}]
+
+--- ARTICLE ---
+{article_text}"""
 
 STATEMENT_EXTRACTION_PROMPT = """Analyze this news article and extract all notable statements or quotes.
 
@@ -28,11 +74,11 @@ For each statement, identify:
 - stance: Their position (pro, con, neutral) on the topic
 - target: What the statement is about
 
-Article:
-{article_text}
-
 Respond with a JSON array of statements:
-[{{"content": "...", "speaker": "...", "speaker_role": "...", "stance": "...", "target": "..."}}]"""
+[{{"content": "...", "speaker": "...", "speaker_role": "...", "stance": "...", "target": "..."}}]
+
+--- ARTICLE ---
+{article_text}"""
 
 ENTITY_EXTRACTION_PROMPT = """Analyze this news article and extract all named entities.
 
@@ -41,24 +87,100 @@ For each entity, identify:
 - entity_type: Category (person, organization, location, law, event_name, etc.)
 - description: Brief description based on the article
 
-Article:
-{article_text}
-
 Respond with a JSON array of entities:
-[{{"name": "...", "entity_type": "...", "description": "..."}}]"""
+[{{"name": "...", "entity_type": "...", "description": "..."}}]
+
+--- ARTICLE ---
+{article_text}"""
 
-TOPIC_EXTRACTION_PROMPT = """Analyze this news article and identify the main topics it covers.
+# Static instructions kept apart from the per-article tail, so extractors only
+# format the short tail (braces here are literal, not format fields)
+TOPIC_EXTRACTION_PREFIX = """Analyze this news article and identify the main topics it covers.
 
 For each topic, provide:
 - name: A clear, specific topic name (e.g., "ICE Operations in Minnesota" not just "Immigration")
 - category: One of: politics, law, international, economy, science, social, other
 - relevance: How central this topic is to the article (0.0-1.0)
 
-Article headline: {headline}
-Article abstract: {abstract}
-
 Respond with a JSON array of topics (max 5):
-[{{"name": "...", "category": "...", "relevance": 0.9}}]"""
+[{"name": "...", "category": "...", "relevance": 0.9}]
+
+--- ARTICLE ---
+"""
+
+TOPIC_EXTRACTION_ARTICLE = """Headline: {headline}
+Abstract: {abstract}"""
+
+TOPIC_EXTRACTION_PROMPT = (
+    TOPIC_EXTRACTION_PREFIX.replace("{", "{{").replace("}", "}}")
+    + TOPIC_EXTRACTION_ARTICLE
+)
+
+EXTRACTION_TASKS = """1. events: All events (things that happened). For each event, identify:
+- description: A clear, factual description of what happened
+- event_type: Category (e.g., arrest, policy_change, statement, meeting, protest, legal_action, etc.)
+- valid_time: When the event actually occurred (ISO format if known, null if unknown)
+- participants: List of people/organizations involved
+- location: Where it happened (if mentioned)
+
+2. statements: All notable statements or quotes. For each statement, identify:
+- content: The actual quote or paraphrased statement
+- speaker: Who said it
+- speaker_role: Their role/title if mentioned
+- stance: Their position (pro, con, neutral) on the topic
+- target: What the statement is about
+
+3. entities: All named entities. For each entity, identify:
+- name: The entity's name
+- entity_type: Category (person, organization, location, law, event_name, etc.)
+- description: Brief description based on the article
+
+4. topics: The main topics the article covers (max 5). For each topic, provide:
+- name: A clear, specific topic name (e.g., "ICE Operations in Minnesota" not just "Immigration")
+- category: One of: politics, law, international, economy, science, social, other
+- relevance: How central this topic is to the article (0.0-1.0)"""
+
+EXTRACTION_RESULT_SCHEMA = """{{"events": [{{"description": "...", "event_type": "...", "valid_time": "...", "participants": [...], "location": "..."}}],
+ "statements": [{{"content": "...", "speaker": "...", "speaker_role": "...", "stance": "...", "target": "..."}}],
+ "entities": [{{"name": "...", "entity_type": "...", "description": "..."}}],
+ "topics": [{{"name": "...", "category": "...", "relevance": 0.9}}]}}"""
+
+COMBINED_EXTRACTION_PROMPT = (
+    """Analyze this news article and extract structured information for four tasks.
+
+"""
+    + EXTRACTION_TASKS
+    + """
+
+Respond with a single JSON object containing all four arrays:
+"""
+    + EXTRACTION_RESULT_SCHEMA
+    + """
+
+--- ARTICLE ---
+{article_text}"""
+)
+
+BATCH_EXTRACTION_PROMPT = (
+    """Analyze each of the numbered news articles below and extract structured information for four tasks.
+
+For each article:
+"""
+    + EXTRACTION_TASKS
+    + """
+
+Respond with a JSON array containing one object per article, in order. Each object has
+an "index" field matching the article number plus the four arrays:
+[{{"index": 0, "events": [...], "statements": [...], "entities": [...], "topics": [...]}}]
+
+Each array uses the same fields as this single-article format:
+"""
+    + EXTRACTION_RESULT_SCHEMA
+    + """
+
+--- ARTICLES ({count}) ---
+{articles}"""
+)
 
 STANCE_DETECTION_PROMPT = """Analyze the following statement and determine the speaker's stance.
 
@@ -115,3 +237,19 @@ Guidelines:
 - Be factual and avoid speculation
 
 Write the article section in markdown format."""
+
+
+EVENT_EXTRACTION_PARTS = split_template(EVENT_EXTRACTION_PROMPT, "article_text")
+STATEMENT_EXTRACTION_PARTS = split_template(STATEMENT_EXTRACTION_PROMPT, "article_text")
+ENTITY_EXTRACTION_PARTS = split_template(ENTITY_EXTRACTION_PROMPT, "article_text")
+COMBINED_EXTRACTION_PARTS = split_template(COMBINED_EXTRACTION_PROMPT, "article_text")
+BATCH_EXTRACTION_PARTS = split_template(BATCH_EXTRACTION_PROMPT, "count", "articles")
+STANCE_DETECTION_PARTS = split_template(
+    STANCE_DETECTION_PROMPT, "statement", "speaker", "context"
+)
+OUTLINE_GENERATION_PARTS = split_template(
+    OUTLINE_GENERATION_PROMPT, "topic", "events", "statements"
+)
+ARTICLE_SYNTHESIS_PARTS = split_template(
+    ARTICLE_SYNTHESIS_PROMPT, "topic", "events", "statements"
+)
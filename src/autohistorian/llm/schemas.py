@@ -0,0 +1,89 @@
+"""Response schemas for Gemini structured output."""
+
+_STRING = {"type": "STRING"}
+_NULLABLE_STRING = {"type": "STRING", "nullable": True}
+
+
+def _array_of(items: dict) -> dict:
+    return {"type": "ARRAY", "items": items}
+
+
+EVENT_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "description": _STRING,
+        "event_type": _STRING,
+        "valid_time": _NULLABLE_STRING,
+        "participants": _array_of(_STRING),
+        "location": _NULLABLE_STRING,
+    },
+    "required": ["description", "event_type"],
+}
+
+STATEMENT_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "content": _STRING,
+        "speaker": _STRING,
+        "speaker_role": _NULLABLE_STRING,
+        "stance": _NULLABLE_STRING,
+        "target": _NULLABLE_STRING,
+    },
+    "required": ["content", "speaker"],
+}
+
+ENTITY_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "name": _STRING,
+        "entity_type": _STRING,
+        "description": _NULLABLE_STRING,
+    },
+    "required": ["name", "entity_type"],
+}
+
+TOPIC_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "name": _STRING,
+        "category": _STRING,
+        "relevance": {"type": "NUMBER"},
+    },
+    "required": ["name", "category", "relevance"],
+}
+
+STANCE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "stance": _STRING,
+        "confidence": {"type": "NUMBER"},
+        "reasoning": _STRING,
+    },
+    "required": ["stance"],
+}
+
+EVENT_LIST_SCHEMA = _array_of(EVENT_SCHEMA)
+STATEMENT_LIST_SCHEMA = _array_of(STATEMENT_SCHEMA)
+ENTITY_LIST_SCHEMA = _array_of(ENTITY_SCHEMA)
+TOPIC_LIST_SCHEMA = _array_of(TOPIC_SCHEMA)
+
+_COMBINED_PROPERTIES = {
+    "events": EVENT_LIST_SCHEMA,
+    "statements": STATEMENT_LIST_SCHEMA,
+    "entities": ENTITY_LIST_SCHEMA,
+    "topics": TOPIC_LIST_SCHEMA,
+}
+
+COMBINED_EXTRACTION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": _COMBINED_PROPERTIES,
+    "required": list(_COMBINED_PROPERTIES),
+}
+
+BATCH_EXTRACTION_SCHEMA = _array_of(
+    {
+        "type": "OBJECT",
+        "properties": {"index": {"type": "INTEGER"}, **_COMBINED_PROPERTIES},
+        "required": ["index", *_COMBINED_PROPERTIES],
+    }
+)
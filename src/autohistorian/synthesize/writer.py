@@ -1,8 +1,5 @@
 """Article synthesis and writing."""
 
-import json
-from typing import Optional
-
 from ..knowledge.store import KnowledgeStore
 from ..llm.client import GeminiClient
 
@@ -29,13 +26,18 @@ class ArticleWriter:
         Returns:
             Article text in markdown format
         """
-        # Get events and statements for the topic
-        events = self.store.get_events_for_topic(topic)
-        statements = self.store.get_statements_for_topic(topic)
+        article, _ = await self._generate_article_with_statements(topic)
+        return article
 
-        # Convert to dicts for the LLM
-        events_data = [e.model_dump(mode="json") for e in events]
-        statements_data = [s.model_dump(mode="json") for s in statements]
+    async def _generate_article_with_statements(
+        self, topic: str
+    ) -> tuple[str, list[dict]]:
+        """Generate the article and also return the statement dicts it was written from."""
+        # The stored records are already JSON-mode dicts, so they go to the
+        # LLM as-is instead of being validated into models and dumped back
+        data = self.store.get_topic_data(topic) or {}
+        events_data = data.get("events", [])
+        statements_data = data.get("statements", [])
 
         # Generate the article
         article = await self.llm_client.synthesize_article(
@@ -49,7 +51,7 @@ class ArticleWriter:
         if timeline:
             article += "\n\n" + timeline
 
-        return article
+        return article, statements_data
 
     async def generate_with_perspectives(self, topic: str) -> str:
         """Generate an article with multiple perspectives highlighted.
@@ -60,33 +62,36 @@ class ArticleWriter:
         Returns:
             Article text with perspectives section
         """
-        article = await self.generate_article(topic)
+        article, statements = await self._generate_article_with_statements(topic)
 
         # Add perspectives section based on statement stances
-        statements = self.store.get_statements_for_topic(topic)
-
         if statements:
             perspectives = "\n\n## Perspectives\n\n"
 
-            # Group by stance
-            pro_statements = [s for s in statements if s.stance == "pro"]
-            con_statements = [s for s in statements if s.stance == "con"]
-            neutral_statements = [s for s in statements if s.stance == "neutral"]
+            # Group by stance in one pass; other stances are left out
+            by_stance: dict[str, list[dict]] = {"pro": [], "con": [], "neutral": []}
+            for s in statements:
+                bucket = by_stance.get(s.get("stance"))
+                if bucket is not None:
+                    bucket.append(s)
+            pro_statements = by_stance["pro"]
+            con_statements = by_stance["con"]
+            neutral_statements = by_stance["neutral"]
 
             if pro_statements:
                 perspectives += "### Supporting Views\n"
                 for s in pro_statements[:3]:
-                    perspectives += f'- **{s.speaker}**: "{s.content}"\n'
+                    perspectives += f'- **{s.get("speaker", "Unknown")}**: "{s.get("content", "")}"\n'
 
             if con_statements:
                 perspectives += "\n### Opposing Views\n"
                 for s in con_statements[:3]:
-                    perspectives += f'- **{s.speaker}**: "{s.content}"\n'
+                    perspectives += f'- **{s.get("speaker", "Unknown")}**: "{s.get("content", "")}"\n'
 
             if neutral_statements:
                 perspectives += "\n### Neutral Analysis\n"
                 for s in neutral_statements[:3]:
-                    perspectives += f'- **{s.speaker}**: "{s.content}"\n'
+                    perspectives += f'- **{s.get("speaker", "Unknown")}**: "{s.get("content", "")}"\n'
 
             article += perspectives
 
@@ -101,8 +106,7 @@ class ArticleWriter:
         Returns:
             Timeline section in markdown
         """
-        valid_items = self.store.get_timeline(topic, use_valid_time=True)
-        obs_items = self.store.get_timeline(topic, use_valid_time=False)
+        valid_items, obs_items = self.store.get_timeline_both(topic, limit=10)
 
         if not valid_items and not obs_items:
             return ""
@@ -112,7 +116,7 @@ class ArticleWriter:
         # When events happened
         section += "### When Events Occurred\n"
         section += "*Chronological order of when events actually happened*\n\n"
-        for item in valid_items[:10]:
+        for item in valid_items:
             time_str = item.get("time", "Unknown date")
             if time_str and len(time_str) > 10:
                 time_str = time_str[:10]
@@ -122,7 +126,7 @@ class ArticleWriter:
         # When we learned
         section += "\n### When We Learned\n"
         section += "*Order in which information was reported*\n\n"
-        for item in obs_items[:10]:
+        for item in obs_items:
             time_str = item.get("time", "Unknown date")
             if time_str and len(time_str) > 10:
                 time_str = time_str[:10]
@@ -143,35 +147,32 @@ class ArticleWriter:
         items = self.store.get_timeline(topic, use_valid_time=True)
 
         events = []
+        append = events.append
         for item in items:
             time_str = item.get("time")
             if not time_str:
                 continue
 
-            # Parse date for TimelineJS format
-            try:
-                year = time_str[:4]
-                month = time_str[5:7] if len(time_str) > 5 else "01"
-                day = time_str[8:10] if len(time_str) > 8 else "01"
-            except (IndexError, TypeError):
-                continue
-
-            event = {
-                "start_date": {
-                    "year": year,
-                    "month": month,
-                    "day": day,
-                },
-                "text": {
-                    "headline": item.get("description", "")[:100],
-                    "text": item.get("description") or item.get("content", ""),
-                },
-            }
-
+            # TimelineJS date parts; missing month/day default to January 1st
+            size = len(time_str)
+            description = item.get("description", "")
+            headline = description[:100]
             if item.get("type") == "statement":
-                event["text"]["headline"] = f'{item.get("speaker", "Unknown")}: {event["text"]["headline"]}'
-
-            events.append(event)
+                headline = f"{item.get('speaker', 'Unknown')}: {headline}"
+
+            append(
+                {
+                    "start_date": {
+                        "year": time_str[:4],
+                        "month": time_str[5:7] if size > 5 else "01",
+                        "day": time_str[8:10] if size > 8 else "01",
+                    },
+                    "text": {
+                        "headline": headline,
+                        "text": description or item.get("content", ""),
+                    },
+                }
+            )
 
         return {
             "title": {
@@ -0,0 +1,21 @@
+"""Tests for ISO timestamp parsing."""
+
+from datetime import UTC, datetime
+
+from autohistorian.dates import parse_iso_datetime
+
+
+def test_parses_nyt_and_llm_formats():
+    assert parse_iso_datetime("2025-01-02T05:00:00+0000") == datetime(
+        2025, 1, 2, 5, tzinfo=UTC
+    )
+    assert parse_iso_datetime("2025-01-02T05:00:00Z") == datetime(
+        2025, 1, 2, 5, tzinfo=UTC
+    )
+    assert parse_iso_datetime("2025-01-02") == datetime(2025, 1, 2)
+
+
+def test_missing_or_malformed_values_return_none():
+    # Unhashable values must not reach the cache
+    for value in (None, "", "last Tuesday", {"date": "2025-01-02"}, ["2025"], 20250102):
+        assert parse_iso_datetime(value) is None
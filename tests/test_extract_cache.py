@@ -0,0 +1,124 @@
+"""Tests for the near-duplicate extraction cache."""
+
+import os
+
+from autohistorian.extract.cache import SemanticExtractCache
+from autohistorian.llm.cache import ResponseCache
+
+RAW = {
+    "events": [{"description": "Council votes on budget"}],
+    "statements": [],
+    "entities": [],
+    "topics": [],
+}
+
+
+def _story() -> str:
+    return " ".join(
+        f"The Springfield council met on day {day} and approved {day * 3} new housing permits."
+        for day in range(1, 31)
+    )
+
+
+def _cache(tmp_path) -> SemanticExtractCache:
+    return SemanticExtractCache(ResponseCache(tmp_path), "test-model")
+
+
+def test_exact_text_hits(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(_story(), RAW)
+
+    assert cache.get(_story()) == RAW
+
+
+def test_near_duplicate_hits(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(_story(), RAW)
+
+    # A reprint with different casing, punctuation, and one edited sentence
+    reprint = _story().upper().replace("approved 30 new", "approved thirty new") + "!"
+
+    assert cache.get(reprint) == RAW
+
+
+def test_distinct_text_misses(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(_story(), RAW)
+
+    other = " ".join(
+        f"Storm {n} brought {n * 2} inches of rain to the coast overnight."
+        for n in range(1, 31)
+    )
+
+    assert cache.get(other) is None
+
+
+def test_short_text_only_matches_exactly(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("Council approves budget.", RAW)
+
+    assert cache.get("Council approves budget.") == RAW
+    assert cache.get("Council approves the budget.") is None
+
+
+def test_index_survives_reload(tmp_path):
+    _cache(tmp_path).put(_story(), RAW)
+
+    reloaded = _cache(tmp_path)
+    reprint = _story().replace("approved 30 new", "approved thirty new")
+
+    assert (tmp_path / SemanticExtractCache.INDEX_FILE).exists()
+    assert reloaded.get(reprint) == RAW
+
+
+def test_index_is_namespaced(tmp_path):
+    _cache(tmp_path).put(_story(), RAW)
+
+    other_model = SemanticExtractCache(ResponseCache(tmp_path), "other-model")
+
+    assert (
+        other_model.get(_story().replace("approved 30 new", "approved thirty new"))
+        is None
+    )
+
+
+def _expire(cache: ResponseCache, text: str) -> None:
+    """Backdate a cached result past the response cache's TTL."""
+    path = cache._path(cache.make_key("test-model", "all", text))
+    old = path.stat().st_mtime - cache.ttl - 60
+    os.utime(path, (old, old))
+
+
+def test_expired_entries_are_pruned_from_index(tmp_path):
+    responses = ResponseCache(tmp_path)
+    cache = SemanticExtractCache(responses, "test-model")
+    other = " ".join(
+        f"Storm {n} brought {n * 2} inches of rain to the coast overnight."
+        for n in range(1, 31)
+    )
+    cache.put(_story(), RAW)
+    cache.put(other, RAW)
+    index_path = tmp_path / SemanticExtractCache.INDEX_FILE
+    with open(index_path, "a") as f:
+        f.write("not json\n")
+    _expire(responses, _story())
+
+    reloaded = _cache(tmp_path)
+
+    assert (
+        reloaded.get(_story().replace("approved 30 new", "approved thirty new")) is None
+    )
+    assert reloaded.get(other.replace("Storm 30", "Storm thirty")) == RAW
+    # The expired and unreadable lines were compacted away
+    assert len(index_path.read_text().splitlines()) == 1
+
+
+def test_entry_expiring_after_load_is_dropped(tmp_path):
+    responses = ResponseCache(tmp_path)
+    cache = SemanticExtractCache(responses, "test-model")
+    cache.put(_story(), RAW)
+    _expire(responses, _story())
+
+    assert cache.get(_story().replace("approved 30 new", "approved thirty new")) is None
+    assert cache._signatures == {}
+    assert cache._buckets == {}
@@ -0,0 +1,108 @@
+"""Tests for the Gemini client's explicit prompt caching."""
+
+import asyncio
+from types import SimpleNamespace
+
+from autohistorian.llm.client import GeminiClient
+
+# Comfortably above MIN_CACHE_TOKENS at ~4 chars per token
+LONG_PROMPT = "Extract events precisely. " * (GeminiClient.MIN_CACHE_TOKENS // 4)
+
+
+class FakeAPI:
+    """Records cache creations and the config each request is sent with."""
+
+    def __init__(self, fail_create: bool = False):
+        self.fail_create = fail_create
+        self.created: list = []
+        self.configs: list = []
+
+    async def create(self, model, config):
+        await asyncio.sleep(0.01)
+        if self.fail_create:
+            raise RuntimeError("caching unavailable")
+        self.created.append(config)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    async def generate_content(self, model, contents, config):
+        self.configs.append(config)
+        return SimpleNamespace(text="ok")
+
+
+def _client(api: FakeAPI) -> GeminiClient:
+    client = GeminiClient("key", requests_per_minute=600)
+    client.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            caches=SimpleNamespace(create=api.create),
+            models=SimpleNamespace(generate_content=api.generate_content),
+        )
+    )
+    return client
+
+
+def test_long_prompt_is_cached_once():
+    api = FakeAPI()
+    client = _client(api)
+
+    async def run():
+        names = await asyncio.gather(
+            *(client.ensure_prompt_cache(LONG_PROMPT) for _ in range(3))
+        )
+        await client._generate("article", LONG_PROMPT, cache=False)
+        return names
+
+    assert asyncio.run(run()) == ["cachedContents/1"] * 3
+    assert len(api.created) == 1
+    assert api.created[0].ttl == "600s"
+    assert api.configs[0].cached_content == "cachedContents/1"
+    assert api.configs[0].system_instruction is None
+
+
+def test_expired_cache_is_recreated():
+    api = FakeAPI()
+    client = _client(api)
+
+    async def run():
+        await client.ensure_prompt_cache(LONG_PROMPT)
+        # Move the refresh deadline into the past
+        name, _, ttl = client._prompt_caches[LONG_PROMPT]
+        client._prompt_caches[LONG_PROMPT] = (name, 0.0, ttl)
+        await asyncio.gather(
+            *(
+                client._generate(f"article {i}", LONG_PROMPT, cache=False)
+                for i in range(3)
+            )
+        )
+
+    asyncio.run(run())
+
+    assert len(api.created) == 2
+    assert [config.cached_content for config in api.configs] == ["cachedContents/2"] * 3
+
+
+def test_failed_create_falls_back_to_system_instruction():
+    api = FakeAPI(fail_create=True)
+    client = _client(api)
+
+    async def run():
+        name = await client.ensure_prompt_cache(LONG_PROMPT)
+        await client._generate("article", LONG_PROMPT, cache=False)
+        return name
+
+    assert asyncio.run(run()) is None
+    assert api.configs[0].cached_content is None
+    assert api.configs[0].system_instruction == LONG_PROMPT
+
+
+def test_short_prompt_is_not_cached():
+    api = FakeAPI()
+    client = _client(api)
+
+    async def run():
+        name = await client.ensure_prompt_cache("Be brief.")
+        await client._generate("article", "Be brief.", cache=False)
+        return name
+
+    assert asyncio.run(run()) is None
+    assert api.created == []
+    assert api.configs[0].system_instruction == "Be brief."
@@ -0,0 +1,169 @@
+"""Tests for the NYT API client."""
+
+import asyncio
+from contextlib import aclosing
+
+import httpx
+import orjson
+
+from autohistorian.ingest.nyt_client import NYTClient
+from autohistorian.ingest.schemas import Article
+
+
+def _doc(**overrides) -> dict:
+    doc = {
+        "web_url": "https://www.nytimes.com/2025/01/02/us/example.html",
+        "headline": {"main": "Example headline", "print_headline": "Example"},
+        "abstract": "An example article.",
+        "pub_date": "2025-01-02T05:00:00+0000",
+        "section_name": "U.S.",
+        "byline": {"original": "By A. Reporter", "organization": None},
+        "keywords": [
+            {"name": "subject", "value": "Elections", "rank": 1, "major": "N"}
+        ],
+        "word_count": 800,
+    }
+    doc.update(overrides)
+    return doc
+
+
+def test_parse_valid_doc():
+    article = NYTClient("key")._parse_article(_doc())
+
+    assert article.headline.main == "Example headline"
+    assert article.byline.original == "By A. Reporter"
+    assert [k.value for k in article.keywords] == ["Elections"]
+    assert article.word_count == 800
+    assert article.pub_date.year == 2025
+
+
+def test_parse_resets_null_and_malformed_fields():
+    doc = _doc(
+        word_count=None,
+        pub_date={"unexpected": "shape"},
+        web_url=None,
+        headline={"main": ["not", "a", "string"], "print_headline": 7},
+        byline={"original": 42},
+        keywords=[
+            {"name": "subject", "value": "Elections", "rank": 1},
+            {"name": "persons", "value": None, "rank": "first"},
+            "not a keyword",
+        ],
+    )
+
+    article = NYTClient("key")._parse_article(doc)
+
+    assert article.word_count == 0
+    assert article.web_url == ""
+    assert article.headline.main == ""
+    assert article.headline.print_headline is None
+    assert article.byline.original is None
+    assert [k.value for k in article.keywords] == ["Elections"]
+
+
+def test_parsed_malformed_doc_round_trips():
+    doc = _doc(word_count=None, keywords="subject", abstract=3)
+
+    article = NYTClient("key")._parse_article(doc)
+
+    # ingest-archive reloads saved articles with model_validate
+    reloaded = Article.model_validate(article.model_dump(mode="json"))
+    assert reloaded == article
+    assert reloaded.keywords == []
+    assert reloaded.abstract is None
+
+
+def test_parse_articles_keeps_every_doc():
+    docs = [_doc(), _doc(word_count="many"), _doc(headline=None)]
+
+    articles = NYTClient("key")._parse_articles(docs)
+
+    assert len(articles) == 3
+    assert len({article.id for article in articles}) == 3
+
+
+def test_parse_does_not_mutate_doc():
+    # Built at runtime so it isn't the interned "subject" literal
+    prefix = "sub"
+    name = f"{prefix}ject"
+    keyword = {"name": name, "value": "Elections"}
+    doc = _doc(keywords=[keyword, "not a keyword"])
+
+    article = NYTClient("key")._parse_article(doc)
+
+    assert article.keywords[0].name == "subject"
+    assert doc["keywords"] == [keyword, "not a keyword"]
+    assert keyword["name"] is name
+
+
+def test_parse_rejects_non_list_keywords():
+    article = NYTClient("key")._parse_article(_doc(keywords={"name": "subject"}))
+
+    assert article.keywords == []
+
+
+def test_search_all_without_pages_makes_no_request():
+    client = NYTClient("key")
+
+    async def search(**kwargs):
+        raise AssertionError("search should not be called")
+
+    client.search = search
+
+    assert asyncio.run(client.search_all(query="news", max_pages=0)) == []
+
+
+class _ArchiveStream(httpx.AsyncByteStream):
+    """Archive response body sent in two chunks, recording whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aiter__(self):
+        docs = [_doc(web_url=f"https://example.com/{i}") for i in range(3)]
+        body = orjson.dumps({"copyright": "c", "response": {"docs": docs}})
+        half = len(body) // 2
+        yield body[:half]
+        yield body[half:]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_stream_archive_range_releases_response_on_early_exit():
+    stream = _ArchiveStream()
+    client = NYTClient("key")
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=stream)
+        )
+    )
+
+    async def first_article():
+        articles = client.stream_archive_range(2025, 1, 2025, 3)
+        async with aclosing(articles):
+            async for article in articles:
+                break
+        # Checked before asyncio.run finalizes any leftover generators
+        return article, stream.closed
+
+    article, closed = asyncio.run(first_article())
+
+    assert article.web_url == "https://example.com/0"
+    assert closed
+
+
+def test_fetch_archive_reads_whole_month():
+    client = NYTClient("key")
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=_ArchiveStream())
+        )
+    )
+
+    archive = asyncio.run(client.fetch_archive(2025, 1))
+
+    assert archive.copyright == "c"
+    assert [a.web_url for a in archive.articles] == [
+        f"https://example.com/{i}" for i in range(3)
+    ]
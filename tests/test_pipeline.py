@@ -0,0 +1,115 @@
+"""Tests for the extraction pipeline."""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime
+
+import pytest
+
+from autohistorian.extract.pipeline import ExtractionPipeline
+from autohistorian.ingest.schemas import Article, Headline
+
+
+class FakeLLM:
+    """Stands in for GeminiClient, failing on articles whose text contains fail_on."""
+
+    model = "fake"
+
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+
+    async def ensure_prompt_cache(self) -> None:
+        return None
+
+    async def extract_all(self, text: str) -> dict:
+        if self.fail_on is not None and self.fail_on in text:
+            raise RuntimeError("extraction failed")
+        await asyncio.sleep(0.01)
+        return {"events": [], "statements": [], "entities": [], "topics": []}
+
+    async def batch_extract_all(self, texts: list[str]) -> list[dict]:
+        return [await self.extract_all(text) for text in texts]
+
+
+def _articles(n: int) -> list[Article]:
+    return [
+        Article(
+            web_url=f"https://example.com/{i}",
+            headline=Headline(main=f"Headline {i}"),
+            abstract=f"Abstract {i}",
+            pub_date=datetime(2025, 1, 1),
+        )
+        for i in range(n)
+    ]
+
+
+async def _stream(articles: list[Article]) -> AsyncIterator[Article]:
+    for article in articles:
+        yield article
+        await asyncio.sleep(0)
+
+
+async def _collect(pipeline: ExtractionPipeline, articles: list[Article]) -> list:
+    return [
+        pair
+        async for pair in pipeline.extract_stream(
+            _stream(articles), max_concurrent=3, flush_interval=0.05
+        )
+    ]
+
+
+def _run(pipeline: ExtractionPipeline, articles: list[Article]) -> list:
+    """Run _collect in a thread so a hung stream fails the test instead of blocking it."""
+    outcome: dict = {}
+
+    def target() -> None:
+        try:
+            outcome["results"] = asyncio.run(_collect(pipeline, articles))
+        except BaseException as error:  # noqa: BLE001 - re-raised on the test thread
+            outcome["error"] = error
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "extract_stream did not finish"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["results"]
+
+
+def test_extract_stream_yields_every_article():
+    articles = _articles(20)
+
+    results = _run(ExtractionPipeline(FakeLLM()), articles)
+
+    assert sorted(article.id for article, _ in results) == sorted(
+        a.id for a in articles
+    )
+
+
+def test_extract_stream_surfaces_extraction_error():
+    # The first article fails while the rest are still being read and batched
+    pipeline = ExtractionPipeline(FakeLLM(fail_on="Abstract 0"))
+
+    for _ in range(5):
+        with pytest.raises(RuntimeError, match="extraction failed") as excinfo:
+            _run(pipeline, _articles(40))
+        assert isinstance(excinfo.value.__cause__, ExceptionGroup)
+
+
+def test_extract_batch_iter_cleans_up_on_early_exit():
+    async def first_then_stop() -> set:
+        pipeline = ExtractionPipeline(FakeLLM())
+        results = pipeline.extract_batch_iter(
+            _articles(20), max_concurrent=2, batch_size=1
+        )
+        async with aclosing(results):
+            async for _ in results:
+                break
+        return {
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        }
+
+    assert asyncio.run(first_then_stop()) == set()
@@ -0,0 +1,224 @@
+"""Tests for the SQLite-backed knowledge store."""
+
+import json
+import sqlite3
+from datetime import datetime
+from uuid import uuid4
+
+from autohistorian.knowledge import db
+from autohistorian.knowledge.models import (
+    Event,
+    ExtractedTopic,
+    ExtractionResult,
+    Statement,
+)
+from autohistorian.knowledge.store import KnowledgeStore
+
+
+def _result(topics: list[str], **times) -> ExtractionResult:
+    article_id = uuid4()
+    return ExtractionResult(
+        article_id=article_id,
+        events=[
+            Event(
+                description="Bill signed",
+                event_type="policy_change",
+                valid_time=times.get("event_valid"),
+                observation_time=datetime(2025, 3, 2),
+                source_article_id=article_id,
+            )
+        ],
+        statements=[
+            Statement(
+                content="This is a historic day.",
+                speaker="The Governor",
+                stance="pro",
+                observation_time=datetime(2025, 3, 1),
+                source_article_id=article_id,
+            )
+        ],
+        topics=[ExtractedTopic(name=name, category="politics") for name in topics],
+    )
+
+
+def _legacy_topic(name: str, article_id: str) -> dict:
+    return {
+        "name": name,
+        "category": "law",
+        "article_ids": [article_id],
+        "events": [
+            {
+                "description": "Court ruling",
+                "event_type": "ruling",
+                "valid_time": "2024-05-01 00:00:00",
+            }
+        ],
+        "statements": [],
+    }
+
+
+def test_save_and_read_topic(tmp_path):
+    store = KnowledgeStore(str(tmp_path))
+    result = _result(["Housing", "State Budget"], event_valid=datetime(2025, 2, 28))
+    store.save_extraction_result(result)
+
+    data = store.get_topic_data("Housing")
+    assert data["category"] == "politics"
+    assert data["article_ids"] == [str(result.article_id)]
+    assert data["events"] == [result.events[0].model_dump(mode="json")]
+    assert data["statements"] == [result.statements[0].model_dump(mode="json")]
+
+    assert store.get_events_for_topic("State Budget") == result.events
+    assert store.get_statements_for_topic("State Budget") == result.statements
+    assert store.get_topics() == ["Housing", "State Budget"]
+    assert store.get_topic_data("Zoning") is None
+
+
+def test_counters_and_stats(tmp_path):
+    store = KnowledgeStore(str(tmp_path))
+    result = _result(["Housing"])
+    store.save_extraction_result(result)
+    # Re-saving an article adds its rows again but doesn't double-count the article
+    store.save_extraction_result(result)
+    store.save_extraction_result(_result(["Housing", "Transit"]))
+
+    info = {topic["name"]: topic for topic in store.get_all_topics_info()}
+    assert info["Housing"]["article_count"] == 2
+    assert info["Housing"]["event_count"] == 3
+    assert info["Transit"]["statement_count"] == 1
+    assert [topic["name"] for topic in store.get_all_topics_info()] == [
+        "Housing",
+        "Transit",
+    ]
+
+    stats = store.get_stats()
+    assert stats["extractions"] == 2
+    assert (stats["topics"], stats["events"], stats["statements"]) == (2, 4, 4)
+
+
+def test_timeline_orders(tmp_path):
+    store = KnowledgeStore(str(tmp_path))
+    store.save_extraction_result(
+        _result(["Housing"], event_valid=datetime(2025, 2, 28))
+    )
+
+    by_valid = store.get_timeline("Housing")
+    by_observed = store.get_timeline("Housing", use_valid_time=False)
+
+    # The event happened first but was reported after the statement
+    assert [item["type"] for item in by_valid] == ["event", "statement"]
+    assert [item["type"] for item in by_observed] == ["statement", "event"]
+    assert by_valid[0]["time"].startswith("2025-02-28")
+    assert store.get_timeline_both("Housing") == (by_valid, by_observed)
+
+
+def test_limited_timeline_matches_full_timeline(tmp_path):
+    store = KnowledgeStore(str(tmp_path))
+    for day in (5, 1, 3, None):
+        valid = datetime(2025, 1, day) if day else None
+        store.save_extraction_result(_result(["Housing"], event_valid=valid))
+
+    for use_valid_time in (True, False):
+        full = store.get_timeline("Housing", use_valid_time)
+        assert store.get_timeline("Housing", use_valid_time, limit=3) == full[:3]
+        assert store.get_timeline("Housing", use_valid_time, limit=100) == full
+
+    valid, observed = store.get_timeline_both("Housing", limit=2)
+    assert valid == store.get_timeline("Housing")[:2]
+    assert observed == store.get_timeline("Housing", use_valid_time=False)[:2]
+
+
+def test_topic_cache_sees_writes_from_other_connections(tmp_path):
+    reader = KnowledgeStore(str(tmp_path))
+    reader.save_extraction_result(_result(["Housing"]))
+    assert len(reader.get_topic_data("Housing")["events"]) == 1
+
+    writer = KnowledgeStore(str(tmp_path))
+    writer.save_extraction_result(_result(["Housing"]))
+    writer.close()
+
+    assert len(reader.get_topic_data("Housing")["events"]) == 2
+
+
+def test_legacy_topic_files_imported_once(tmp_path):
+    topics_dir = tmp_path / "topics"
+    topics_dir.mkdir()
+    article_id = str(uuid4())
+    (topics_dir / "courts.json").write_text(
+        json.dumps(_legacy_topic("Courts", article_id))
+    )
+
+    store = KnowledgeStore(str(tmp_path))
+    data = store.get_topic_data("Courts")
+    assert data["category"] == "law"
+    assert data["article_ids"] == [article_id]
+    assert [event["description"] for event in data["events"]] == ["Court ruling"]
+    store.close()
+
+    # Files left behind, or added later, are not imported again
+    (topics_dir / "elections.json").write_text(
+        json.dumps(_legacy_topic("Elections", article_id))
+    )
+    reopened = KnowledgeStore(str(tmp_path))
+    assert reopened.get_topics() == ["Courts"]
+    assert len(reopened.get_topic_data("Courts")["events"]) == 1
+    assert reopened.get_stats()["events"] == 1
+
+
+def test_upgrade_from_version_1(tmp_path):
+    # Version 1 had no per-topic counters and indexed (topic, valid_time)
+    conn = sqlite3.connect(tmp_path / "knowledge.db")
+    conn.executescript(
+        """
+        CREATE TABLE topics (name TEXT PRIMARY KEY, category TEXT NOT NULL DEFAULT 'other');
+        CREATE TABLE topic_articles (
+            topic TEXT NOT NULL, article_id TEXT NOT NULL, PRIMARY KEY (topic, article_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE events (
+            id INTEGER PRIMARY KEY, topic TEXT NOT NULL, valid_time TEXT,
+            observation_time TEXT, data BLOB NOT NULL
+        );
+        CREATE TABLE statements (
+            id INTEGER PRIMARY KEY, topic TEXT NOT NULL, valid_time TEXT,
+            observation_time TEXT, data BLOB NOT NULL
+        );
+        CREATE INDEX events_topic_valid_time ON events (topic, valid_time);
+        CREATE INDEX statements_topic_valid_time ON statements (topic, valid_time);
+        INSERT INTO topics VALUES ('Courts', 'law');
+        INSERT INTO topic_articles VALUES ('Courts', 'a1'), ('Courts', 'a2');
+        INSERT INTO events (topic, valid_time, data)
+            VALUES ('Courts', '2024-05-01', '{"description": "Court ruling", "valid_time": "2024-05-01"}');
+        PRAGMA user_version = 1;
+        """
+    )
+    conn.close()
+    # A leftover topics directory must not be imported into an existing database
+    (tmp_path / "topics").mkdir()
+    (tmp_path / "topics" / "courts.json").write_text(
+        json.dumps(_legacy_topic("Courts", "a3"))
+    )
+
+    store = KnowledgeStore(str(tmp_path))
+
+    assert store.conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+    indexes = {
+        name
+        for (name,) in store.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    assert "events_topic_valid_time" not in indexes
+    assert {"events_topic_valid_key", "statements_topic_observed_key"} <= indexes
+
+    [info] = store.get_all_topics_info()
+    assert (info["article_count"], info["event_count"], info["statement_count"]) == (
+        2,
+        1,
+        0,
+    )
+    assert store.get_timeline("Courts", limit=5)[0]["description"] == "Court ruling"
+
+    # Counters keep counting from the recomputed values
+    store.save_extraction_result(_result(["Courts"]))
+    [info] = store.get_all_topics_info()
+    assert (info["article_count"], info["event_count"]) == (3, 2)